@@ -0,0 +1,172 @@
+import numpy as np
+
+# Liczba ustawionych bitów dla każdej wartości bajtu
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def smallest_dtype(values):
+    """
+    Dobiera najmniejszy typ wystarczający do dokładnego zapisania wartości macierzy.
+
+    Wartości całkowite: uint8 (0..255), int16, int32 lub int64.
+    Pozostałe (także nan/inf): float32, jeśli konwersja jest bezstratna, inaczej float64.
+    """
+    a = np.asarray(values, dtype=np.float64)
+    if a.size == 0:
+        return np.dtype(np.uint8)
+    finite = np.isfinite(a)
+    if finite.all() and np.array_equal(a, np.round(a)):
+        low, high = a.min(), a.max()
+        for dtype in (np.uint8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+    if np.array_equal(a.astype(np.float32), a, equal_nan=True):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def compact_matrix(matrix):
+    """
+    Zwraca macierz (lista list lub np.ndarray) jako np.ndarray najmniejszego typu
+    (smallest_dtype). None oznacza brak krawędzi i zamieniane jest na nan.
+    """
+    a = np.array(matrix, dtype=np.float64)
+    return a.astype(smallest_dtype(a))
+
+
+class BitsetGraph:
+    """
+    Macierz sąsiedztwa upakowana bitowo: wiersz u to np.packbits(matrix[u]),
+    czyli ceil(n / 8) bajtów zamiast n liczb int64 (64 razy mniej pamięci).
+
+    Operacje na zbiorach wierzchołków (sąsiedztwo wielu wierzchołków naraz,
+    wspólni sąsiedzi, odwiedzone wierzchołki) są wektorowymi OR/AND na bajtach.
+
+    Atrybuty:
+        bits (np.ndarray): Tablica uint8 kształtu (n, ceil(n / 8)).
+        n (int): Liczba wierzchołków.
+        directed (bool): Czy graf jest skierowany.
+    """
+
+    __slots__ = ("bits", "n", "directed")
+
+    def __init__(self, bits, n, directed=False):
+        bits = np.asarray(bits, dtype=np.uint8)
+        if bits.shape != (n, (n + 7) // 8):
+            raise ValueError("bits must have shape (n, ceil(n / 8))")
+        self.bits = bits
+        self.n = n
+        self.directed = directed
+
+    # ----------------------------
+    # Konstruktory
+    # ----------------------------
+    @classmethod
+    def from_adjacency_matrix(cls, matrix, directed=None, missing=0):
+        """
+        Tworzy graf z macierzy sąsiedztwa (None, nan i inf oznaczają brak krawędzi,
+        podobnie jak wartość missing). directed=None - wykrycie na podstawie symetrii.
+        """
+        a = np.array(matrix, dtype=np.float64)
+        if a.ndim != 2 or a.shape[0] != a.shape[1]:
+            raise ValueError("Adjacency matrix must be square")
+        mask = np.isfinite(a)
+        if missing is not None:
+            mask &= a != missing
+        if directed is None:
+            directed = not np.array_equal(mask, mask.T)
+        return cls(np.packbits(mask, axis=1), a.shape[0], directed)
+
+    @classmethod
+    def from_edges(cls, src, dst, n=None, directed=False):
+        """Tworzy graf z tablic końców krawędzi (indeksy 0..n-1)."""
+        src = np.asarray(src, dtype=np.int64).ravel()
+        dst = np.asarray(dst, dtype=np.int64).ravel()
+        if n is None:
+            n = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        if not directed:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+        bits = np.zeros((n, (n + 7) // 8), dtype=np.uint8)
+        # Ustawienie bitu dst w wierszu src (bitowy OR z powtórzeniami)
+        np.bitwise_or.at(bits, (src, dst >> 3), (0x80 >> (dst & 7)).astype(np.uint8))
+        return cls(bits, n, directed)
+
+    @classmethod
+    def from_csr(cls, graph):
+        """Tworzy graf z CSRGraph (wagi są pomijane)."""
+        src, dst, _ = graph.arcs()
+        # CSR grafu nieskierowanego przechowuje już oba kierunki
+        bits = cls.from_edges(src, dst, n=len(graph), directed=True).bits
+        return cls(bits, len(graph), graph.directed)
+
+    # ----------------------------
+    # Dostęp do struktury
+    # ----------------------------
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return f"BitsetGraph(n={self.n}, {kind}, {self.bits.nbytes} bytes)"
+
+    def to_dense(self, dtype=np.uint8):
+        """Zwraca pełną macierz sąsiedztwa 0/1."""
+        return np.unpackbits(self.bits, axis=1, count=self.n).astype(dtype, copy=False)
+
+    def has_edge(self, u, v):
+        return bool(self.bits[u, v >> 3] & (0x80 >> (v & 7)))
+
+    def _unpack(self, row):
+        return np.unpackbits(row, count=self.n).view(bool)
+
+    def neighbors(self, u):
+        """Zwraca tablicę sąsiadów (następników) wierzchołka u."""
+        return np.flatnonzero(self._unpack(self.bits[u]))
+
+    def degree(self):
+        """Zwraca tablicę stopni (wyjściowych) wierzchołków."""
+        return _POPCOUNT[self.bits].sum(axis=1, dtype=np.int64)
+
+    def common_neighbors(self, u, v):
+        """Zwraca wspólnych sąsiadów u i v (AND wierszy)."""
+        return np.flatnonzero(self._unpack(self.bits[u] & self.bits[v]))
+
+    # ----------------------------
+    # Przeszukiwanie
+    # ----------------------------
+    def bfs(self, source):
+        """
+        BFS poziomami: następna warstwa to OR wierszy całej bieżącej warstwy
+        z wyzerowanymi bitami już odwiedzonych wierzchołków.
+        Zwraca tablicę odległości (liczba krawędzi, -1 - nieosiągalny).
+        """
+        distances = np.full(self.n, -1, dtype=np.int64)
+        visited = np.zeros(self.bits.shape[1], dtype=np.uint8)
+        visited[source >> 3] |= 0x80 >> (source & 7)
+        frontier = np.array([source])
+        level = 0
+        while frontier.size:
+            distances[frontier] = level
+            level += 1
+            reached = np.bitwise_or.reduce(self.bits[frontier], axis=0) & ~visited
+            visited |= reached
+            frontier = np.flatnonzero(self._unpack(reached))
+        return distances
+
+    def reachable(self, source):
+        """Zwraca maskę wierzchołków osiągalnych z source."""
+        return self.bfs(source) >= 0
+
+    def transitive_closure(self):
+        """
+        Domknięcie przechodnie algorytmem Warshalla na wierszach bitowych:
+        dla każdego k wiersze zawierające k dostają OR wiersza k.
+        Zwraca nowy BitsetGraph (u -> v, gdy v jest osiągalny z u ścieżką długości >= 1).
+        """
+        closure = self.bits.copy()
+        for k in range(self.n):
+            column = (closure[:, k >> 3] & (0x80 >> (k & 7))) != 0
+            closure[column] |= closure[k]
+        return BitsetGraph(closure, self.n, self.directed)
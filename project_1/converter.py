@@ -1,42 +1,113 @@
 import numpy as np
 import networkx as nx
 
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy jest opcjonalne - potrzebne tylko dla sparse="csr"/"coo"
+    sp = None
 
-def graph_to_adjacency_matrix(G):
+SPARSE_FORMATS = (None, "csr", "coo", "triple", "bits")
+
+
+def _edge_arrays(G):
+    """Zwraca listę wierzchołków oraz tablice indeksów końców krawędzi grafu."""
+    nodes = list(G.nodes())
+    node_index = {node: i for i, node in enumerate(nodes)}
+    m = G.number_of_edges()
+    src = np.fromiter((node_index[u] for u, _ in G.edges()), dtype=np.int64, count=m)
+    dst = np.fromiter((node_index[v] for _, v in G.edges()), dtype=np.int64, count=m)
+    return nodes, src, dst
+
+
+def _build_matrix(rows, cols, shape, sparse):
+    """
+    Buduje macierz zero-jedynkową z pozycji jedynek (duplikaty są scalane).
+
+    sparse: None - gęsta np.ndarray, "csr"/"coo" - macierz scipy.sparse,
+    "triple" - krotka (rows, cols, data) w formacie COO bez zależności od scipy,
+    "bits" - macierz upakowana bitowo (BitsetGraph, tylko macierze kwadratowe).
+    """
+    if sparse not in SPARSE_FORMATS:
+        raise ValueError(f"sparse must be one of {SPARSE_FORMATS}")
+    if sparse == "bits":
+        if shape[0] != shape[1]:
+            raise ValueError("sparse='bits' requires a square matrix")
+        # Import leniwy - main_1.py importuje ten moduł jako skrypt (bez pakietu project_1)
+        from project_1.bitset_graph import BitsetGraph
+
+        # Pozycje są już symetryczne - from_edges nie musi ich odbijać
+        bits = BitsetGraph.from_edges(rows, cols, n=shape[0], directed=True).bits
+        return BitsetGraph(bits, shape[0], directed=False)
+
+    if sparse is None:
+        matrix = np.zeros(shape, dtype=int)
+        matrix[rows, cols] = 1
+        return matrix
+
+    keys = np.unique(rows * shape[1] + cols)
+    rows, cols = keys // shape[1], keys % shape[1]
+    data = np.ones(keys.size, dtype=np.int8)
+    if sparse == "triple":
+        return rows, cols, data
+    if sp is None:
+        raise ImportError("scipy is required for sparse='csr' or sparse='coo'")
+    matrix = sp.coo_matrix((data, (rows, cols)), shape=shape)
+    return matrix.tocsr() if sparse == "csr" else matrix
+
+
+def _matrix_entries(matrix):
+    """
+    Zwraca (rows, cols, data, shape) niezerowych elementów macierzy gęstej,
+    macierzy scipy.sparse lub krotki COO (rows, cols, data).
+    """
+    if sp is not None and sp.issparse(matrix):
+        coo = matrix.tocoo()
+        return coo.row, coo.col, coo.data, coo.shape
+    if isinstance(matrix, tuple) and len(matrix) == 3:
+        rows, cols, data = (np.asarray(x) for x in matrix)
+        shape = (
+            int(rows.max(initial=-1)) + 1,
+            int(cols.max(initial=-1)) + 1,
+        )
+        return rows, cols, data, shape
+    return None
+
+
+def graph_to_adjacency_matrix(G, sparse=None):
     """
     Zamienia graf NetworkX na macierz sąsiedztwa (ręczna implementacja).
 
     Parametry:
         G (nx.Graph): Graf nieskierowany.
+        sparse (str lub None): None - gęsta macierz, "csr"/"coo" - macierz
+            scipy.sparse, "triple" - krotka COO (rows, cols, data),
+            "bits" - BitsetGraph (1 bit na element).
 
     Zwraca:
-        np.ndarray: Kwadratowa macierz sąsiedztwa typu int.
+        np.ndarray: Kwadratowa macierz sąsiedztwa typu int (lub postać rzadka).
     """
     if not isinstance(G, nx.Graph):
         raise TypeError("Input must be a NetworkX Graph")
 
     if len(G.nodes()) == 0:
-        return np.zeros((0, 0), dtype=int)
+        return _build_matrix(np.zeros(0, np.int64), np.zeros(0, np.int64), (0, 0), sparse)
 
-    nodes = list(G.nodes())
+    nodes, src, dst = _edge_arrays(G)
     n = len(nodes)
-    node_index = {node: i for i, node in enumerate(nodes)}
-    matrix = np.zeros((n, n), dtype=int)
-
-    for u, v in G.edges():
-        i, j = node_index[u], node_index[v]
-        matrix[i][j] = 1
-        matrix[j][i] = 1
-
-    return matrix
+    rows = np.concatenate((src, dst))
+    cols = np.concatenate((dst, src))
+    return _build_matrix(rows, cols, (n, n), sparse)
 
 
-def graph_to_incidence_matrix(G):
+def graph_to_incidence_matrix(G, sparse=None):
     """
     Zamienia graf NetworkX na macierz incydencji.
 
     Parametry:
         G (nx.Graph): Graf nieskierowany.
+        sparse (str lub None): None - gęsta macierz, "csr"/"coo" - macierz
+            scipy.sparse, "triple" - krotka COO (rows, cols, data).
+            Postać rzadka zajmuje O(m) pamięci zamiast O(n * m).
 
     Zwraca:
         np.ndarray: Macierz incydencji (n wierzchołków x m krawędzi).
@@ -45,20 +116,13 @@ def graph_to_incidence_matrix(G):
         raise TypeError("Input must be a NetworkX Graph")
 
     if len(G.nodes()) == 0 or len(G.edges()) == 0:
-        return np.zeros((0, 0), dtype=int)
-
-    nodes = list(G.nodes())
-    num_nodes = len(nodes)
-    num_edges = len(G.edges())
-
-    node_index = {node: i for i, node in enumerate(nodes)}
-    incidence_matrix = np.zeros((num_nodes, num_edges), dtype=int)
-
-    for edge_index, (u, v) in enumerate(G.edges()):
-        incidence_matrix[node_index[u], edge_index] = 1
-        incidence_matrix[node_index[v], edge_index] = 1
+        return _build_matrix(np.zeros(0, np.int64), np.zeros(0, np.int64), (0, 0), sparse)
 
-    return incidence_matrix
+    nodes, src, dst = _edge_arrays(G)
+    edge_index = np.arange(src.size)
+    rows = np.concatenate((src, dst))
+    cols = np.concatenate((edge_index, edge_index))
+    return _build_matrix(rows, cols, (len(nodes), src.size), sparse)
 
 
 def graph_to_adjacency_list(G):
@@ -82,30 +146,39 @@ def adjacency_matrix_to_graph(matrix):
     Konwertuje macierz sąsiedztwa na graf NetworkX.
 
     Parametry:
-        matrix (list lub np.ndarray): Kwadratowa macierz sąsiedztwa.
+        matrix (list, np.ndarray, scipy.sparse lub krotka COO): Kwadratowa macierz sąsiedztwa.
 
     Zwraca:
         nx.Graph: Odtworzony graf.
     """
     if matrix is None:
         raise ValueError("Matrix cannot be None")
-    if not isinstance(matrix, (np.ndarray, list)):
-        raise TypeError("Input must be a numpy array or nested list")
 
-    matrix = np.array(matrix)
-    if matrix.size == 0:
-        return nx.Graph()
-    if matrix.shape[0] != matrix.shape[1]:
-        raise ValueError("Adjacency matrix must be square")
+    entries = _matrix_entries(matrix)
+    if entries is not None:
+        rows, cols, data, _ = entries
+        upper = (cols > rows) & (data > 0)
+        i, j, weights = rows[upper], cols[upper], data[upper]
+        order = np.lexsort((j, i))
+        i, j, weights = i[order], j[order], weights[order]
+    else:
+        if not isinstance(matrix, (np.ndarray, list)):
+            raise TypeError("Input must be a numpy array or nested list")
+
+        matrix = np.array(matrix)
+        if matrix.size == 0:
+            return nx.Graph()
+        if matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Adjacency matrix must be square")
+
+        i, j = np.nonzero(np.triu(matrix > 0, k=1))
+        weights = matrix[i, j]
 
     G = nx.Graph()
-    num_nodes = matrix.shape[0]
-
-    for i in range(num_nodes):
-        for j in range(i + 1, num_nodes):
-            if matrix[i][j] > 0:
-                G.add_edge(i + 1, j + 1, weight=matrix[i][j])
-
+    G.add_edges_from(
+        (u, v, {"weight": w})
+        for u, v, w in zip((i + 1).tolist(), (j + 1).tolist(), weights.tolist())
+    )
     return G
 
 
@@ -114,32 +187,45 @@ def incidence_matrix_to_graph(matrix):
     Konwertuje macierz incydencji na graf NetworkX.
 
     Parametry:
-        matrix (list lub np.ndarray): Macierz incydencji (n wierzchołków x m krawędzi).
+        matrix (list, np.ndarray, scipy.sparse lub krotka COO): Macierz
+            incydencji (n wierzchołków x m krawędzi).
 
     Zwraca:
         nx.Graph: Odtworzony graf.
     """
     if matrix is None:
         raise ValueError("Matrix cannot be None")
-    if not isinstance(matrix, (np.ndarray, list)):
-        raise TypeError("Input must be a numpy array or nested list")
-
-    matrix = np.array(matrix)
-    if matrix.ndim != 2:
-        raise ValueError("Incidence matrix must be 2D")
-    if matrix.size == 0 or matrix.shape[1] == 0:
-        return nx.Graph()
 
+    entries = _matrix_entries(matrix)
+    if entries is not None:
+        rows, cols, data, shape = entries
+        ones = data == 1
+        rows, cols = rows[ones], cols[ones]
+        num_edges = shape[1]
+    else:
+        if not isinstance(matrix, (np.ndarray, list)):
+            raise TypeError("Input must be a numpy array or nested list")
+
+        matrix = np.array(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("Incidence matrix must be 2D")
+        if matrix.size == 0 or matrix.shape[1] == 0:
+            return nx.Graph()
+        cols, rows = np.nonzero(matrix.T == 1)
+        num_edges = matrix.shape[1]
+
+    # Jedynki pogrupowane według kolumn (krawędzi), w kolumnie rosnąco po wierszach
+    order = np.lexsort((rows, cols))
+    rows, cols = rows[order], cols[order]
+    counts = np.bincount(cols, minlength=num_edges)
+
+    too_many = np.flatnonzero(counts > 2)
+    if too_many.size:
+        raise ValueError(f"Edge index {too_many[0]} connects more than two nodes")
+
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[counts == 2]
     G = nx.Graph()
-    num_nodes, num_edges = matrix.shape
-
-    for edge_index in range(num_edges):
-        nodes = np.where(matrix[:, edge_index] == 1)[0]
-        if len(nodes) == 2:
-            G.add_edge(nodes[0] + 1, nodes[1] + 1)
-        elif len(nodes) > 2:
-            raise ValueError(f"Edge index {edge_index} connects more than two nodes")
-
+    G.add_edges_from(zip((rows[starts] + 1).tolist(), (rows[starts + 1] + 1).tolist()))
     return G
 
 
@@ -167,3 +253,28 @@ def adjacency_list_to_graph(adj_list):
         for neighbor in neighbors:
             G.add_edge(node, neighbor)
     return G
+
+
+def graph_to_csr_file(G, path, weight="weight"):
+    """
+    Zapisuje graf NetworkX do binarnego pliku CSR (project_1.graph_file),
+    który można później wczytać bez kopiowania przez load_csr.
+
+    Parametry:
+        G (nx.Graph): Graf (skierowany lub nieskierowany).
+        path (str): Ścieżka pliku.
+        weight (str): Atrybut krawędzi z wagą (domyślnie 1).
+
+    Zwraca:
+        CSRGraph: Zapisany graf (w pamięci).
+    """
+    if not isinstance(G, nx.Graph):
+        raise TypeError("Input must be a NetworkX Graph")
+
+    # Import leniwy - main_1.py importuje ten moduł jako skrypt (bez pakietu project_1)
+    from project_1.csr_graph import CSRGraph
+    from project_1.graph_file import save_csr
+
+    graph = CSRGraph.from_networkx(G, weight=weight)
+    save_csr(graph, path)
+    return graph
@@ -0,0 +1,267 @@
+import numpy as np
+
+
+def _index_dtype(n):
+    """Dobiera najmniejszy typ całkowity wystarczający do indeksowania n wierzchołków."""
+    return np.int32 if n < 2**31 else np.int64
+
+
+class CSRGraph:
+    """
+    Zwarta reprezentacja grafu w formacie CSR (Compressed Sparse Row).
+
+    Sąsiedzi wierzchołka u to indices[indptr[u]:indptr[u + 1]], a wagi
+    odpowiadających im krawędzi to weights[indptr[u]:indptr[u + 1]].
+    Graf nieskierowany przechowuje każdą krawędź w obu kierunkach.
+    Pamięć wynosi O(n + m) zamiast O(n^2) dla macierzy sąsiedztwa.
+
+    Atrybuty:
+        indptr (np.ndarray): Tablica długości n + 1 z początkami wierszy.
+        indices (np.ndarray): Tablica długości m z końcami krawędzi.
+        weights (np.ndarray): Tablica długości m z wagami krawędzi.
+        directed (bool): Czy graf jest skierowany.
+        labels (list lub None): Oryginalne etykiety wierzchołków (None gdy 0..n-1).
+    """
+
+    __slots__ = ("indptr", "indices", "weights", "directed", "labels")
+
+    def __init__(self, indptr, indices, weights=None, directed=False, labels=None):
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if indptr.ndim != 1 or indptr.size == 0:
+            raise ValueError("indptr must be a non-empty 1D array")
+        if indices.ndim != 1 or indptr[-1] != indices.size:
+            raise ValueError("indices must be a 1D array of length indptr[-1]")
+        if indptr.dtype.kind not in "iu":
+            indptr = indptr.astype(np.int64)
+        if indices.dtype.kind not in "iu":
+            indices = indices.astype(_index_dtype(indptr.size - 1))
+
+        if weights is None:
+            weights = np.ones(indices.size, dtype=np.float64)
+        else:
+            weights = np.asarray(weights)
+            if weights.dtype.kind not in "iuf":
+                weights = weights.astype(np.float64)
+            if weights.shape != indices.shape:
+                raise ValueError("weights must have the same length as indices")
+
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+        self.labels = labels
+
+    # ----------------------------
+    # Konstruktory
+    # ----------------------------
+    @classmethod
+    def from_edges(cls, src, dst, weights=None, n=None, directed=False, labels=None):
+        """
+        Tworzy graf CSR z listy krawędzi podanej jako tablice początków i końców.
+
+        Parametry:
+            src, dst (array-like): Końce krawędzi (indeksy 0..n-1).
+            weights (array-like lub None): Wagi krawędzi (domyślnie 1).
+            n (int lub None): Liczba wierzchołków (domyślnie max indeks + 1).
+            directed (bool): Dla grafu nieskierowanego krawędzie są
+                symetryzowane, a duplikaty usuwane (zostaje najmniejsza waga).
+
+        Zwraca:
+            CSRGraph: Graf w formacie CSR.
+        """
+        src = np.asarray(src).ravel()
+        dst = np.asarray(dst).ravel()
+        if src.shape != dst.shape:
+            raise ValueError("src and dst must have the same length")
+        if src.dtype.kind not in "iu":
+            src = src.astype(np.int64)
+        if dst.dtype.kind not in "iu":
+            dst = dst.astype(np.int64)
+        if weights is None:
+            weights = np.ones(src.size, dtype=np.float64)
+        else:
+            weights = np.asarray(weights).ravel()
+            if weights.shape != src.shape:
+                raise ValueError("weights must have the same length as src")
+        if n is None:
+            n = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        if src.size and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+            raise ValueError("Edge endpoints must be in range 0..n-1")
+
+        if not directed:
+            loops = src == dst
+            src, dst = np.concatenate((src, dst[~loops])), np.concatenate((dst, src[~loops]))
+            weights = np.concatenate((weights, weights[~loops]))
+            # Sortowanie po (src, dst, waga) - pierwsza z powtórzonych krawędzi ma najmniejszą wagę
+            order = np.lexsort((weights, dst, src))
+            src, dst, weights = src[order], dst[order], weights[order]
+            keep = np.ones(src.size, dtype=bool)
+            keep[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst, weights = src[keep], dst[keep], weights[keep]
+        else:
+            order = np.lexsort((dst, src))
+            src, dst, weights = src[order], dst[order], weights[order]
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(indptr, dst.astype(_index_dtype(n)), weights, directed, labels)
+
+    @classmethod
+    def from_adjacency_matrix(cls, matrix, directed=None, missing=0):
+        """
+        Tworzy graf CSR z macierzy sąsiedztwa (lista list lub np.ndarray).
+
+        Parametry:
+            matrix: Kwadratowa macierz sąsiedztwa.
+            directed (bool lub None): None oznacza wykrycie na podstawie symetrii macierzy.
+            missing: Wartość oznaczająca brak krawędzi (poza None i math.inf,
+                które zawsze oznaczają brak krawędzi). Dla macierzy wag z
+                projektu 4, gdzie 0 jest poprawną wagą, należy podać None.
+
+        Zwraca:
+            CSRGraph: Graf w formacie CSR.
+        """
+        a = np.array(matrix, dtype=np.float64)  # None -> nan
+        if a.ndim != 2 or a.shape[0] != a.shape[1]:
+            raise ValueError("Adjacency matrix must be square")
+
+        mask = np.isfinite(a)
+        if missing is not None:
+            mask &= a != missing
+        if directed is None:
+            directed = not (
+                np.array_equal(mask, mask.T) and np.array_equal(a[mask], a.T[mask])
+            )
+
+        n = a.shape[0]
+        src, dst = np.nonzero(mask)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(indptr, dst.astype(_index_dtype(n)), a[mask], directed)
+
+    @classmethod
+    def from_adjacency_list(cls, adj_list, directed=False):
+        """
+        Tworzy graf CSR z listy sąsiedztwa {wierzchołek: [sąsiedzi]}.
+
+        Sąsiedzi mogą być podani jako etykiety lub pary (etykieta, waga).
+        Jeśli etykiety to liczby całkowite nieujemne, są używane bezpośrednio
+        jako indeksy; w przeciwnym razie są numerowane w kolejności wystąpienia,
+        a oryginały trafiają do atrybutu labels.
+        """
+        if not isinstance(adj_list, dict):
+            raise TypeError("Adjacency list must be a dictionary")
+
+        src, dst, weights = [], [], []
+        for node, neighbors in adj_list.items():
+            for neighbor in neighbors:
+                if isinstance(neighbor, tuple):
+                    neighbor, weight = neighbor
+                else:
+                    weight = 1
+                src.append(node)
+                dst.append(neighbor)
+                weights.append(weight)
+
+        nodes = list(adj_list)
+        seen = set(nodes)
+        nodes.extend(v for v in dst if v not in seen and not seen.add(v))
+
+        if all(isinstance(v, (int, np.integer)) and v >= 0 for v in nodes):
+            labels = None
+            n = max(nodes) + 1 if nodes else 0
+        else:
+            labels = nodes
+            index = {label: i for i, label in enumerate(labels)}
+            src = [index[u] for u in src]
+            dst = [index[v] for v in dst]
+            n = len(labels)
+
+        return cls.from_edges(
+            np.array(src, dtype=np.int64),
+            np.array(dst, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            n=n,
+            directed=directed,
+            labels=labels,
+        )
+
+    @classmethod
+    def from_networkx(cls, G, weight="weight"):
+        """Tworzy graf CSR z grafu NetworkX (wagi z atrybutu `weight`, domyślnie 1)."""
+        labels = list(G.nodes())
+        index = {label: i for i, label in enumerate(labels)}
+        m = G.number_of_edges()
+        src = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.int64, count=m)
+        dst = np.fromiter((index[v] for _, v in G.edges()), dtype=np.int64, count=m)
+        w = np.fromiter(
+            (d.get(weight, 1) for _, _, d in G.edges(data=True)), dtype=np.float64, count=m
+        )
+        return cls.from_edges(
+            src, dst, w, n=len(labels), directed=G.is_directed(), labels=labels
+        )
+
+    # ----------------------------
+    # Dostęp do struktury
+    # ----------------------------
+    def __len__(self):
+        return self.indptr.size - 1
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return f"CSRGraph(n={self.number_of_nodes()}, m={self.number_of_edges()}, {kind})"
+
+    def number_of_nodes(self):
+        return self.indptr.size - 1
+
+    def number_of_edges(self):
+        """Liczba krawędzi (dla grafu nieskierowanego każda liczona raz)."""
+        if self.directed:
+            return int(self.indices.size)
+        loops = int(np.count_nonzero(self.indices == self._sources()))
+        return (int(self.indices.size) - loops) // 2 + loops
+
+    def neighbors(self, u):
+        """Zwraca tablicę sąsiadów (następników) wierzchołka u."""
+        return self.indices[self.indptr[u] : self.indptr[u + 1]]
+
+    def neighbor_weights(self, u):
+        """Zwraca wagi krawędzi wychodzących z wierzchołka u."""
+        return self.weights[self.indptr[u] : self.indptr[u + 1]]
+
+    def degree(self):
+        """Zwraca tablicę stopni (wyjściowych) wierzchołków."""
+        return np.diff(self.indptr)
+
+    def _sources(self):
+        n = self.number_of_nodes()
+        return np.repeat(np.arange(n, dtype=_index_dtype(n)), np.diff(self.indptr))
+
+    def arcs(self):
+        """Zwraca wszystkie przechowywane łuki jako tablice (src, dst, weights)."""
+        return self._sources(), self.indices, self.weights
+
+    def edges(self):
+        """
+        Zwraca krawędzie jako trzy tablice (src, dst, weights).
+        Dla grafu nieskierowanego każda krawędź występuje raz (src <= dst).
+        """
+        src = self._sources()
+        if self.directed:
+            return src, self.indices, self.weights
+        mask = src <= self.indices
+        return src[mask], self.indices[mask], self.weights[mask]
+
+    def transpose(self):
+        """Zwraca graf transponowany (dla grafu nieskierowanego - ten sam graf)."""
+        if not self.directed:
+            return self
+        return CSRGraph.from_edges(
+            self.indices,
+            self._sources(),
+            self.weights,
+            n=self.number_of_nodes(),
+            directed=True,
+            labels=self.labels,
+        )
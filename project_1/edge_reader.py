@@ -0,0 +1,230 @@
+import gzip
+import os
+
+import networkx as nx
+import numpy as np
+
+from project_1.csr_graph import CSRGraph, _index_dtype
+
+# Strumieniowe wczytywanie list krawędzi "u v [w]" (tekst, CSV, gzip).
+# Plik czytany jest blokami bajtów, blok dzielony na tokeny jednym split(),
+# a etykiety wierzchołków numerowane słownikiem (etykieta -> kolejny numer).
+# W pamięci trzymane są tylko numery wierzchołków i wagi, nie tekst pliku.
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open(path):
+    """Otwiera plik binarnie; pliki gzip rozpoznawane są po sygnaturze."""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    return gzip.open(path, "rb") if magic == GZIP_MAGIC else open(path, "rb")
+
+
+def _default_delimiter(path):
+    name = os.fspath(path).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return "," if name.endswith(".csv") else None
+
+
+def _blocks(path, block_size):
+    """Zwraca kolejne bloki pliku zakończone pełnym wierszem."""
+    rest = b""
+    with _open(path) as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                rest = block
+                continue
+            rest = block[cut:]
+            yield block[:cut]
+    if rest:
+        yield rest
+
+
+class LabelIndex:
+    """
+    Słownik etykieta -> gęsty numer wierzchołka (0, 1, 2, ... w kolejności
+    pierwszego wystąpienia). Blok etykiet jest numerowany wektorowo:
+    słownik odpytywany jest tylko raz dla każdej różnej etykiety w bloku.
+    """
+
+    __slots__ = ("index", "labels")
+
+    def __init__(self):
+        self.index = {}
+        self.labels = []
+
+    def __len__(self):
+        return len(self.labels)
+
+    def encode(self, tokens):
+        """Zamienia tablicę etykiet (napisów) na tablicę numerów int64."""
+        unique, first, inverse = np.unique(tokens, return_index=True, return_inverse=True)
+        unique = unique.tolist()
+        ids = [0] * len(unique)
+        index, labels = self.index, self.labels
+        # Nowe etykiety numerowane w kolejności wystąpienia w bloku
+        for k in np.argsort(first, kind="stable").tolist():
+            label = unique[k]
+            i = index.get(label)
+            if i is None:
+                i = index[label] = len(labels)
+                labels.append(label)
+            ids[k] = i
+        return np.array(ids, dtype=np.int64)[inverse.ravel()]
+
+
+def read_edge_chunks(
+    path,
+    delimiter="auto",
+    comments="#",
+    skip_header=False,
+    block_size=1 << 24,
+    labels=None,
+):
+    """
+    Generator bloków krawędzi z pliku z listą krawędzi.
+
+    Każdy wiersz to "u v" lub "u v w" (kolumny oddzielone białymi znakami
+    albo znakiem delimiter, bez cudzysłowów CSV). Wiersze puste i zaczynające
+    się od znaku komentarza są pomijane.
+
+    Parametry:
+        path (str): Ścieżka pliku (może być skompresowany gzip).
+        delimiter (str lub None): Separator kolumn; "auto" - przecinek dla
+            plików .csv/.csv.gz, w pozostałych białe znaki.
+        comments (str lub None): Znak rozpoczynający komentarz.
+        skip_header (bool): Pomija pierwszy wiersz (nagłówek CSV).
+        block_size (int): Rozmiar bloku w bajtach.
+        labels (LabelIndex lub None): Słownik etykiet; None - etykiety są
+            liczbami całkowitymi używanymi bezpośrednio jako numery.
+
+    Zwraca:
+        Iterator krotek (src, dst, weights) tablic NumPy; weights jest None
+        dla plików bez wag.
+    """
+    if delimiter == "auto":
+        delimiter = _default_delimiter(path)
+    columns = None
+    header = skip_header
+
+    for block in _blocks(path, block_size):
+        text = block.decode()
+        if header:
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            header = False
+        if comments and comments in text:
+            text = "\n".join(
+                line for line in text.splitlines() if not line.lstrip().startswith(comments)
+            )
+        if delimiter is not None:
+            text = text.replace(delimiter, " ")
+
+        if columns is None:
+            first = next((line for line in text.splitlines() if line.strip()), None)
+            if first is None:
+                continue
+            columns = len(first.split())
+            if columns not in (2, 3):
+                raise ValueError("Edge list rows must have 2 or 3 columns")
+
+        tokens = np.array(text.split())
+        if tokens.size % columns:
+            raise ValueError(f"Every edge list row must have {columns} columns")
+        tokens = tokens.reshape(-1, columns)
+
+        if labels is None:
+            src = tokens[:, 0].astype(np.int64)
+            dst = tokens[:, 1].astype(np.int64)
+        else:
+            ids = labels.encode(tokens[:, :2].ravel()).reshape(-1, 2)
+            src, dst = ids[:, 0], ids[:, 1]
+        weights = tokens[:, 2].astype(np.float64) if columns == 3 else None
+        yield src, dst, weights
+
+
+def read_edge_list(
+    path,
+    output="csr",
+    directed=False,
+    relabel=True,
+    label_type=str,
+    delimiter="auto",
+    comments="#",
+    skip_header=False,
+    block_size=1 << 24,
+):
+    """
+    Wczytuje listę krawędzi z pliku tekstowego, CSV lub gzip.
+
+    Parametry:
+        path (str): Ścieżka pliku.
+        output (str): "csr" - CSRGraph, "arrays" - krotka (src, dst, weights, labels),
+            "networkx" - nx.Graph / nx.DiGraph, "flow" - FlowNetwork z project_5
+            (wagi są przepustowościami).
+        directed (bool): Czy krawędzie są skierowane (dla "flow" zawsze tak).
+        relabel (bool): Numeruje dowolne etykiety słownikiem; False - etykiety
+            są liczbami całkowitymi 0..n-1 używanymi bezpośrednio.
+        label_type (callable): Konwersja etykiet z napisów (np. int) dla
+            wyników z oryginalnymi etykietami.
+        Pozostałe parametry jak w read_edge_chunks.
+
+    Zwraca:
+        Graf w formacie wskazanym przez output. Wagi domyślnie wynoszą 1.
+    """
+    if output not in ("csr", "arrays", "networkx", "flow"):
+        raise ValueError("output must be 'csr', 'arrays', 'networkx' or 'flow'")
+
+    index = LabelIndex() if relabel else None
+    sources, targets, weights = [], [], []
+    for src, dst, w in read_edge_chunks(
+        path, delimiter, comments, skip_header, block_size, labels=index
+    ):
+        # Numery wierzchołków trzymane w najmniejszym wystarczającym typie
+        sources.append(src.astype(np.int32) if src.size and src.max() < 2**31 else src)
+        targets.append(dst.astype(np.int32) if dst.size and dst.max() < 2**31 else dst)
+        weights.append(np.ones(src.size) if w is None else w)
+
+    src = np.concatenate(sources) if sources else np.zeros(0, dtype=np.int64)
+    dst = np.concatenate(targets) if targets else np.zeros(0, dtype=np.int64)
+    w = np.concatenate(weights) if weights else np.zeros(0)
+    if index is not None:
+        n = len(index)
+        labels = [label_type(label) for label in index.labels]
+    else:
+        n = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        labels = None
+    src = src.astype(_index_dtype(n), copy=False)
+    dst = dst.astype(_index_dtype(n), copy=False)
+
+    if output == "arrays":
+        return src, dst, w, labels
+    if output == "csr":
+        return CSRGraph.from_edges(src, dst, w, n=n, directed=directed, labels=labels)
+
+    names = labels if labels is not None else range(n)
+    if output == "networkx":
+        G = nx.DiGraph() if directed else nx.Graph()
+        G.add_nodes_from(names)
+        G.add_weighted_edges_from(
+            zip(
+                (names[u] for u in src.tolist()),
+                (names[v] for v in dst.tolist()),
+                w.tolist(),
+            )
+        )
+        return G
+
+    # Import leniwy - project_5 nie jest potrzebny dla pozostałych formatów
+    from project_5.main import FlowNetwork
+
+    network = FlowNetwork()
+    for u, v, capacity in zip(src.tolist(), dst.tolist(), w.tolist()):
+        network.add_edge(names[u], names[v], int(capacity) if capacity.is_integer() else capacity)
+    return network
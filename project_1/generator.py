@@ -1,4 +1,5 @@
 import networkx as nx
+import numpy as np
 import random
 
 
@@ -24,4 +25,105 @@ def generate_random_graph_np(n, p):
             if random.random() < p:
                 G.add_edge(i, j)
 
-    return G
\ No newline at end of file
+    return G
+
+
+def _pairs_from_index(k):
+    """
+    Zamienia indeksy liniowe par (v, w), w < v, w kolejności
+    k = v * (v - 1) / 2 + w na tablicę krawędzi (m, 2) z kolumnami (w, v).
+    """
+    k = np.asarray(k, dtype=np.int64)
+    v = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    # Korekta błędów zaokrągleń pierwiastka dla dużych k
+    v -= v * (v - 1) // 2 > k
+    v += (v + 1) * v // 2 <= k
+    w = k - v * (v - 1) // 2
+    return np.column_stack((w, v))
+
+
+def _edges_to_graph(n, edges):
+    """Tworzy nx.Graph o wierzchołkach 1..n z tablicy krawędzi numerowanych od 0."""
+    G = nx.Graph()
+    G.add_nodes_from(range(1, n + 1))
+    G.add_edges_from((edges + 1).tolist())
+    return G
+
+
+def bernoulli_indices(total, p, rng):
+    """
+    Zwraca posortowane indeksy 0..total-1, z których każdy wybrany jest niezależnie
+    z prawdopodobieństwem p. Losowane są odstępy między wybranymi indeksami
+    (rozkład geometryczny), więc czas zależy od liczby wybranych, a nie od total.
+    """
+    if p <= 0 or total == 0:
+        return np.zeros(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+
+    chunks = []
+    position = -1
+    expected = total * p
+    while position < total:
+        size = int(expected + 5 * np.sqrt(expected) + 16)
+        gaps = rng.geometric(p, size=size)
+        positions = position + np.cumsum(gaps, dtype=np.int64)
+        chunks.append(positions[positions < total])
+        position = int(positions[-1])
+    return np.concatenate(chunks)
+
+
+def generate_random_graph_np_fast(n, p, seed=None, as_array=False):
+    """
+    Generuje losowy graf G(n, p) metodą przeskoków geometrycznych (Batagelj, Brandes).
+
+    Zamiast losować każdą z n(n - 1) / 2 par, losowane są odstępy między kolejnymi
+    krawędziami (rozkład geometryczny), a ich sumy prefiksowe dają indeksy liniowe
+    krawędzi. Czas jest proporcjonalny do liczby wygenerowanych krawędzi.
+
+    :param n: liczba wierzchołków
+    :param p: prawdopodobieństwo krawędzi
+    :param seed: ziarno lub numpy.random.Generator
+    :param as_array: zwróć tablicę krawędzi (m, 2) numerowanych od 0 zamiast nx.Graph
+    :return: graf G(n, p) (wierzchołki 1..n) lub tablica krawędzi
+    """
+    rng = np.random.default_rng(seed)
+    edges = _pairs_from_index(bernoulli_indices(n * (n - 1) // 2, p, rng))
+    return edges if as_array else _edges_to_graph(n, edges)
+
+
+def generate_random_graph_nl_fast(n, l, seed=None, as_array=False):
+    """
+    Generuje losowy graf G(n, l) losując l różnych indeksów liniowych par
+    bez materializowania listy wszystkich możliwych krawędzi.
+
+    Indeksy losowane są wektorowo z niewielkim nadmiarem, duplikaty usuwane
+    przez np.unique, a brakujące krawędzie dolosowywane. Gdy l przekracza połowę wszystkich
+    par, losowane są pary do pominięcia.
+
+    :param n: liczba wierzchołków
+    :param l: liczba krawędzi (obcinana do n(n - 1) / 2)
+    :param seed: ziarno lub numpy.random.Generator
+    :param as_array: zwróć tablicę krawędzi (m, 2) numerowanych od 0 zamiast nx.Graph
+    :return: graf G(n, l) (wierzchołki 1..n) lub tablica krawędzi
+    """
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    l = min(l, total)
+    complement = 2 * l > total
+    count = total - l if complement else l
+
+    chosen = np.zeros(0, dtype=np.int64)
+    while chosen.size < count:
+        missing = count - chosen.size
+        drawn = rng.integers(total, size=missing + missing // 8 + 16, dtype=np.int64)
+        merged = np.concatenate((chosen, drawn))
+        # Pierwsze wystąpienia w kolejności losowania - obcięcie nadmiaru nie zaburza rozkładu
+        _, first = np.unique(merged, return_index=True)
+        chosen = merged[np.sort(first)[:count]]
+
+    if complement:
+        chosen = np.setdiff1d(np.arange(total, dtype=np.int64), chosen, assume_unique=True)
+
+    edges = _pairs_from_index(chosen)
+    return edges if as_array else _edges_to_graph(n, edges)
@@ -0,0 +1,152 @@
+import json
+import struct
+
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+
+# Binarny format grafu CSR:
+#   nagłówek (64 bajty): magic, wersja, flagi, n, m, typy tablic, długość etykiet
+#   tablice indptr (n + 1), indices (m), weights (m) - każda od przesunięcia
+#   będącego wielokrotnością 64 bajtów, w porządku little-endian
+#   opcjonalnie etykiety wierzchołków jako JSON
+# Tablice wczytywane są przez np.memmap, więc plik nie jest kopiowany do pamięci,
+# a wiele procesów otwierających ten sam plik współdzieli strony pamięci podręcznej.
+
+MAGIC = b"CSRGRAPH"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ4s4s4sQ")
+_HEADER_SIZE = 64
+_ALIGN = 64
+_DIRECTED = 1
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _layout(n, m, dtypes):
+    """Zwraca przesunięcia tablic indptr, indices, weights i etykiet w pliku."""
+    offsets = []
+    offset = _HEADER_SIZE
+    for count, dtype in zip((n + 1, m, m), dtypes):
+        offsets.append(offset)
+        offset = _aligned(offset + count * dtype.itemsize)
+    offsets.append(offset)
+    return offsets
+
+
+def _json_label(obj):
+    """Skalary NumPy (np. węzły np.int64) zapisywane są jako zwykłe liczby Pythona."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Label of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_labels(labels):
+    """Etykiety jako JSON lub b"", jeśli któraś nie daje się zserializować."""
+    if labels is None:
+        return b""
+    try:
+        return json.dumps(list(labels), default=_json_label).encode()
+    except (TypeError, ValueError):
+        return b""
+
+
+def _decode_label(label):
+    """JSON zapisuje krotki jako listy - etykiety muszą być hashowalne, więc wracają do krotek."""
+    if isinstance(label, list):
+        return tuple(_decode_label(x) for x in label)
+    return label
+
+
+def save_csr(graph, path):
+    """
+    Zapisuje CSRGraph do pliku binarnego (nagłówek + tablice CSR).
+    Etykiety wierzchołków są zapisywane jako JSON: skalary NumPy zamieniane są
+    na liczby Pythona, a krotki (np. węzły grid_2d_graph) odtwarzane przy wczytaniu.
+    Jeśli którejś etykiety nie da się zserializować, etykiety są pomijane
+    (load_csr zwraca wtedy graf z labels=None).
+    """
+    arrays = [
+        np.ascontiguousarray(a, dtype=np.dtype(a.dtype).newbyteorder("<"))
+        for a in (graph.indptr, graph.indices, graph.weights)
+    ]
+    n, m = len(graph), arrays[1].size
+    labels = _encode_labels(graph.labels)
+    offsets = _layout(n, m, [a.dtype for a in arrays])
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        _DIRECTED if graph.directed else 0,
+        n,
+        m,
+        *(a.dtype.str.encode() for a in arrays),
+        len(labels),
+    )
+    with open(path, "wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\0"))
+        for offset, array in zip(offsets, arrays):
+            f.seek(offset)
+            array.tofile(f)
+        f.seek(offsets[-1])
+        f.write(labels)
+
+
+def load_csr(path, mode="r"):
+    """
+    Wczytuje graf zapisany przez save_csr bez kopiowania tablic (np.memmap).
+
+    Parametry:
+        path (str): Ścieżka pliku.
+        mode (str): Tryb np.memmap - "r" (tylko odczyt), "r+" lub "c" (kopia przy zapisie).
+
+    Zwraca:
+        CSRGraph: Graf, którego tablice są mapowane z pliku.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(_HEADER_SIZE)
+        if len(raw) < _HEADER.size:
+            raise ValueError("File is too short to be a CSR graph file")
+        magic, version, flags, n, m, *dtypes, labels_size = _HEADER.unpack_from(raw)
+        if magic != MAGIC:
+            raise ValueError("Not a CSR graph file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported CSR graph file version: {version}")
+        dtypes = [np.dtype(d.rstrip(b"\0").decode()) for d in dtypes]
+        offsets = _layout(n, m, dtypes)
+        labels = None
+        if labels_size:
+            f.seek(offsets[-1])
+            labels = [_decode_label(label) for label in json.loads(f.read(labels_size))]
+
+    indptr, indices, weights = (
+        # Pusta tablica nie może być mapowana - tworzona jest w pamięci
+        np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=(count,))
+        if count
+        else np.zeros(0, dtype=dtype)
+        for count, dtype, offset in zip((n + 1, m, m), dtypes, offsets)
+    )
+    return CSRGraph(indptr, indices, weights, directed=bool(flags & _DIRECTED), labels=labels)
+
+
+def mmap_source(array):
+    """
+    Jeśli tablica jest w całości mapowana z pliku, zwraca (ścieżka, przesunięcie, długość,
+    typ), co pozwala innym procesom otworzyć ją ponownie zamiast kopiować; inaczej None.
+    """
+    base = array
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    if base is None or base.filename is None or array.ndim != 1:
+        return None
+    if base.ctypes.data != array.ctypes.data or base.shape != array.shape:
+        return None
+    return str(base.filename), base.offset, array.shape[0], array.dtype
+
+
+def open_mmap_source(source, mode="r"):
+    """Otwiera tablicę opisaną przez mmap_source."""
+    path, offset, count, dtype = source
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=(count,))
@@ -0,0 +1,77 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from project_1.graph_file import mmap_source, open_mmap_source
+
+# Przekazywanie tablic NumPy do procesów roboczych bez kopiowania:
+# tablice mapowane z pliku (load_csr) procesy otwierają same, pozostałe trafiają
+# do pamięci współdzielonej. Procesy dostają tylko krótkie opisy tablic.
+
+
+class SharedArrays:
+    """
+    Tablice udostępnione procesom roboczym (strona procesu głównego).
+
+    Atrybuty:
+        arrays (list): Widoki tablic w procesie głównym; zapisy do tablic
+            z pamięci współdzielonej są widoczne w procesach roboczych.
+        specs (list): Opisy tablic dla attach_arrays (do initargs puli procesów).
+
+    Bloki pamięci współdzielonej są zwalniane przez close() lub na końcu bloku with;
+    widoki z arrays nie mogą być wtedy przechowywane poza obiektem.
+    """
+
+    __slots__ = ("arrays", "specs", "_blocks")
+
+    def __init__(self, arrays):
+        self.arrays, self.specs, self._blocks = [], [], []
+        try:
+            for array in arrays:
+                self._share(np.asarray(array))
+        except BaseException:
+            self.close()
+            raise
+
+    def _share(self, array):
+        source = mmap_source(array)
+        if source is not None:
+            self.arrays.append(array)
+            self.specs.append(("file", source))
+            return
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        self.arrays.append(view)
+        self.specs.append(("shm", (block.name, array.shape, array.dtype)))
+
+    def close(self):
+        self.arrays = []
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_arrays(specs):
+    """
+    Otwiera w procesie roboczym tablice opisane przez SharedArrays.specs.
+    Zwraca (bloki, tablice) - bloki muszą żyć razem z widokami tablic.
+    """
+    blocks, arrays = [], []
+    for kind, spec in specs:
+        if kind == "file":
+            arrays.append(open_mmap_source(spec))
+            continue
+        name, shape, dtype = spec
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=block.buf))
+    return blocks, arrays
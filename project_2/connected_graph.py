@@ -1,22 +1,51 @@
 import networkx as nx
-from collections import defaultdict
+import numpy as np
+from collections import deque
+from project_1.csr_graph import CSRGraph
+from project_1.disjoint_set import DisjointSet
 from project_1.draw_graph import draw_circle_graph
 
 
-def components_R(nr, i, G, connected_graph_list):
+def connected_components_bfs(G):
     """
-    Rekurencyjna funkcja do oznaczania wierzchołków należących do tej samej składowej spójności.
-    Przechodzi po sąsiadach wierzchołka i oznacza je numerem komponentu spójności.
+    Iteracyjne wyznaczanie składowych spójności przeszukiwaniem wszerz.
+    Nie korzysta z rekurencji, więc działa dla dowolnie długich ścieżek,
+    a wierzchołki mogą mieć dowolne etykiety.
 
-    :param nr: numer komponentu spójności, który jest przypisany do wierzchołka
-    :param i: aktualnie odwiedzany wierzchołek
-    :param G: graf, w którym szukamy komponentów spójności
-    :param connected_graph_list: lista, w której przechowywane są numery komponentów spójności dla każdego wierzchołka
+    :param G: graf NetworkX lub CSRGraph
+    :return: tablica numerów składowych (od 1) w kolejności list(G.nodes()) lub indeksów CSR
     """
-    for j in G.neighbors(i):
-        if connected_graph_list[j] == -1:
-            connected_graph_list[j] = nr
-            components_R(nr, j, G, connected_graph_list)
+    if isinstance(G, CSRGraph):
+        indptr, indices = G.indptr.tolist(), G.indices.tolist()
+        n = len(G)
+
+        def neighbors(u):
+            return indices[indptr[u] : indptr[u + 1]]
+
+    else:
+        nodes = list(G.nodes())
+        n = len(nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+
+        def neighbors(u):
+            return [index[v] for v in G.neighbors(nodes[u])]
+
+    labels = np.zeros(n, dtype=np.int64)
+    nr = 0
+    for start in range(n):
+        if labels[start]:
+            continue
+        nr += 1
+        labels[start] = nr
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            for v in neighbors(u):
+                if not labels[v]:
+                    labels[v] = nr
+                    queue.append(v)
+
+    return labels
 
 
 def connected_components_R(G):
@@ -25,40 +54,90 @@ def connected_components_R(G):
     Dla każdego wierzchołka przypisuje numer komponentu spójności, do którego należy.
 
     :param G: graf, w którym szukamy komponentów spójności
-    :return: lista, w której dla każdego wierzchołka zapisany jest numer komponentu spójności
+    :return: tablica, w której dla każdego wierzchołka zapisany jest numer komponentu spójności
     """
-    connected_graph_list = [-1 for _ in range(G.number_of_nodes())]
-    nr = 0
+    return connected_components_bfs(G)
+
+
+def _number_by_first_occurrence(roots):
+    """Zamienia reprezentantów składowych na numery 1..k w kolejności pierwszego wystąpienia."""
+    _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+    numbers = np.empty(first.size, dtype=np.int64)
+    numbers[np.argsort(first)] = np.arange(1, first.size + 1)
+    return numbers[inverse]
+
 
-    for i in range(G.number_of_nodes()):
-        if connected_graph_list[i] == -1:
-            nr += 1
-            connected_graph_list[i] = nr
-            components_R(nr, i, G, connected_graph_list)
+def connected_components_union_find(edges, n):
+    """
+    Wyznacza składowe spójności ze strumienia krawędzi strukturą zbiorów rozłącznych.
+    Krawędzie nie muszą mieścić się w pamięci ani tworzyć obiektu nx.Graph.
+
+    :param edges: iterowalny zbiór par (u, v) lub tablic NumPy o kształcie (k, 2)
+        (np. kolejne fragmenty pliku z listą krawędzi); wierzchołki to 0..n-1
+    :param n: liczba wierzchołków
+    :return: tablica numerów składowych (od 1) dla wierzchołków 0..n-1
+    """
+    sets = DisjointSet(n)
+    for item in edges:
+        if isinstance(item, np.ndarray) and item.ndim == 2:
+            for u, v in item.tolist():
+                sets.union(u, v)
+        else:
+            sets.union(item[0], item[1])
+
+    return _number_by_first_occurrence(sets.roots())
+
+
+def connected_components_label_propagation(graph):
+    """
+    Wektorowa propagacja etykiet na tablicach CSR: każdy wierzchołek przyjmuje
+    najmniejszą etykietę sąsiada (np.minimum.at), a skoki po etykietach
+    (labels[labels]) skracają liczbę rund.
+
+    :param graph: CSRGraph (nieskierowany)
+    :return: tablica numerów składowych (od 1)
+    """
+    n = len(graph)
+    src, dst, _ = graph.arcs()
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, dst, labels[src])
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
 
-    return connected_graph_list
+    return _number_by_first_occurrence(labels)
 
 
-def print_components(connected_graph_list):
+def print_components(connected_graph_list, nodes=None):
     """
     Funkcja do wypisania wszystkich komponentów spójności w grafie.
-    Grupuje wierzchołki według komponentu spójności i wypisuje je w formie listy.
+    Rozmiary składowych liczone są przez np.bincount, a wierzchołki
+    grupowane jednym sortowaniem tablicy numerów.
 
-    :param connected_graph_list: lista numerów komponentów spójności dla każdego wierzchołka
+    :param connected_graph_list: tablica numerów komponentów spójności (od 1) dla każdego wierzchołka
+    :param nodes: etykiety wierzchołków (domyślnie indeksy 0..n-1)
     """
-    components = defaultdict(list)
+    labels = np.asarray(connected_graph_list)
+    nodes = np.arange(labels.size) if nodes is None else np.asarray(list(nodes))
+    sizes = np.bincount(labels)
 
-    for vertex, component_num in enumerate(connected_graph_list):
-        components[component_num].append(vertex)
+    order = np.argsort(labels, kind="stable")
+    groups = np.split(nodes[order], np.cumsum(sizes)[:-1])
 
     print("Składowe spójności:")
-    for comp_num in sorted(components.keys()):
-        vertices = " ".join(map(str, components[comp_num]))
+    for comp_num in np.nonzero(sizes)[0]:
+        vertices = " ".join(map(str, groups[comp_num].tolist()))
         print(f"{comp_num}) {vertices}")
 
     # Określamy numer największej składowej
-    largest_component = max(components.items(), key=lambda x: len(x[1]))[0]
-    print(f"Największa składowa ma numer {largest_component}.")
+    largest_component = int(np.argmax(sizes))
+    print(
+        f"Największa składowa ma numer {largest_component} "
+        f"(liczba wierzchołków: {sizes[largest_component]})."
+    )
 
 
 def main():
@@ -71,8 +150,8 @@ def main():
     G.add_edges_from([(0, 1), (1, 2)])
     G.add_edges_from([(3, 4), (4, 5), (5, 3), (5, 6)])
 
-    connected_graph_list = connected_components_R(G)
-    print_components(connected_graph_list)
+    connected_graph_list = connected_components_bfs(G)
+    print_components(connected_graph_list, G.nodes())
     draw_circle_graph(G, radius=10, name="components_graph.png", weights=False)
 
 
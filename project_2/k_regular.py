@@ -1,5 +1,6 @@
 import random
 import networkx as nx
+import numpy as np
 from project_1.draw_graph import draw_circle_graph
 
 
@@ -52,6 +53,113 @@ def generate_k_regular_graph_manual(n, k):
     return G
 
 
+def _pairing_attempt(n, k, rng, max_switches):
+    """
+    Jedna próba modelu konfiguracyjnego: losowe skojarzenie n*k "półkrawędzi",
+    a następnie naprawa pętli i krawędzi wielokrotnych zamianami krawędzi.
+    Zwraca tablicę krawędzi (m, 2) lub None, jeśli naprawa się nie powiodła.
+    """
+    stubs = rng.permutation(np.repeat(np.arange(n, dtype=np.int64), k)).reshape(-1, 2)
+    u = stubs.min(axis=1)
+    v = stubs.max(axis=1)
+    keys = u * n + v
+
+    # Krawędź jest poprawna, jeśli nie jest pętlą i jest pierwszym wystąpieniem swojej pary
+    _, first = np.unique(keys, return_index=True)
+    good = np.zeros(keys.size, dtype=bool)
+    good[first] = True
+    good &= u != v
+
+    edges_u, edges_v = u.tolist(), v.tolist()
+    present = set(keys[good].tolist())
+    bad = np.nonzero(~good)[0].tolist()
+    good_count = keys.size - len(bad)
+    switches = 0
+
+    # Zamiana (a, b), (c, d) -> (a, c), (b, d) z losowo wybraną poprawną krawędzią
+    while bad:
+        if switches >= max_switches or good_count == 0:
+            return None
+        switches += 1
+        i = bad[-1]
+        j = int(rng.integers(keys.size))
+        if j == i or edges_u[j] * n + edges_v[j] not in present or not good[j]:
+            continue
+        a, b = edges_u[i], edges_v[i]
+        c, d = edges_u[j], edges_v[j]
+        if rng.random() < 0.5:
+            c, d = d, c
+        if a == c or b == d:
+            continue
+        key_ac = min(a, c) * n + max(a, c)
+        key_bd = min(b, d) * n + max(b, d)
+        if key_ac == key_bd or key_ac in present or key_bd in present:
+            continue
+
+        present.discard(min(c, d) * n + max(c, d))
+        present.add(key_ac)
+        present.add(key_bd)
+        edges_u[i], edges_v[i] = min(a, c), max(a, c)
+        edges_u[j], edges_v[j] = min(b, d), max(b, d)
+        good[i] = True
+        good_count += 1
+        bad.pop()
+
+    return np.column_stack((edges_u, edges_v)).astype(np.int64)
+
+
+def generate_k_regular_graph_pairing(n, k, seed=None, max_retries=50, as_array=False):
+    """
+    Generuje losowy graf k-regularny modelem konfiguracyjnym (pairing model).
+
+    Półkrawędzie są tasowane wektorowo w NumPy, a pętle i krawędzie wielokrotne
+    usuwane losowymi zamianami krawędzi zachowującymi stopnie. Jeśli naprawa
+    nie powiedzie się w limicie zamian, próba jest powtarzana (iteracyjnie,
+    co najwyżej max_retries razy). Dla k > (n - 1) / 2 generowane jest
+    dopełnienie grafu (n - 1 - k)-regularnego.
+
+    :param n: liczba wierzchołków w grafie
+    :param k: stopień każdego wierzchołka
+    :param seed: ziarno dla numpy.random.default_rng
+    :param max_retries: maksymalna liczba prób
+    :param as_array: zwróć tablicę krawędzi (m, 2) zamiast nx.Graph
+    :return: graf k-regularny
+    :raises ValueError: jeśli n * k nie jest liczbą parzystą lub jeśli k >= n
+    :raises RuntimeError: jeśli nie udało się wygenerować grafu w limicie prób
+    """
+    if (n * k) % 2 != 0:
+        raise ValueError("n * k musi być parzyste, aby graf istniał!")
+
+    if k >= n:
+        raise ValueError("Stopień k musi być mniejszy niż liczba wierzchołków n!")
+
+    rng = np.random.default_rng(seed)
+
+    if 2 * k > n - 1:
+        complement = generate_k_regular_graph_pairing(n, n - 1 - k, rng, max_retries, True)
+        matrix = ~np.eye(n, dtype=bool)
+        matrix[complement[:, 0], complement[:, 1]] = False
+        matrix[complement[:, 1], complement[:, 0]] = False
+        edges = np.column_stack(np.nonzero(np.triu(matrix)))
+    elif k == 0:
+        edges = np.zeros((0, 2), dtype=np.int64)
+    else:
+        edges = None
+        for _ in range(max_retries):
+            edges = _pairing_attempt(n, k, rng, max_switches=10 * n * k + 100)
+            if edges is not None:
+                break
+        if edges is None:
+            raise RuntimeError("Nie udało się wygenerować grafu k-regularnego")
+
+    if as_array:
+        return edges
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(edges.tolist())
+    return G
+
+
 def main():
     """
     Funkcja główna programu, która generuje graf k-regularny, rysuje go i wypisuje jego krawędzie.
@@ -59,7 +167,7 @@ def main():
     n = 10
     k = 4
 
-    G = generate_k_regular_graph_manual(n, k)
+    G = generate_k_regular_graph_pairing(n, k)
 
     draw_circle_graph(G, radius=10, name="k_regular_graph.png", weights=False)
 
@@ -1,7 +1,8 @@
 import random
 import networkx as nx
+import numpy as np
 from project_1.draw_graph import draw_circle_graph
-from project_2.sequence_graph import havel_hakimi, build_graph
+from project_2.sequence_graph import erdos_gallai, havel_hakimi_buckets
 
 
 def generating_euler_graph(nodes_num):
@@ -14,13 +15,97 @@ def generating_euler_graph(nodes_num):
         for _ in range(nodes_num):
             sequence.append(random.choice([i for i in range(2, nodes_num + 1, 2)]))
 
-        if havel_hakimi(sequence):
-            G = build_graph(sequence)
+        if erdos_gallai(sequence):
+            G = havel_hakimi_buckets(sequence)
             if nx.is_connected(G) and all(d % 2 == 0 for _, d in G.degree()):
                 print("Znaleziono sekwencję:", sequence)
                 return G
 
 
+def generate_euler_graph_fast(
+    nodes_num, extra_cycles=None, max_ear=None, seed=None, as_array=False
+):
+    """
+    Generuje losowy graf Eulerowski bez losowania i odrzucania ciągów stopni.
+
+    Graf powstaje z rozkładu uszowego: losowy cykl początkowy, a następnie
+    zamknięte "uszy" - cykle przez losowy istniejący wierzchołek i kilka nowych
+    (pojedynczy pozostały wierzchołek dzieli losową krawędź). Każdy krok zachowuje
+    spójność i parzystość stopni. Na koniec dodawane są krótkie losowe cykle na
+    istniejących wierzchołkach; cykl, który powieliłby krawędź, jest pomijany, a liczba prób
+    jest ograniczona, więc czas działania wynosi O(n + m).
+
+    :param nodes_num: liczba wierzchołków (co najmniej 3)
+    :param extra_cycles: liczba dodatkowych cykli (domyślnie nodes_num // 2)
+    :param max_ear: maksymalna liczba nowych wierzchołków w jednym uchu, co najmniej 2
+        (domyślnie ~sqrt(n))
+    :param seed: ziarno dla numpy.random.default_rng
+    :param as_array: zwróć tablicę krawędzi (m, 2) zamiast nx.Graph
+    :return: spójny graf o parzystych stopniach (wierzchołki 0..nodes_num-1)
+    """
+    if nodes_num < 3:
+        raise ValueError("Graf Eulerowski prosty wymaga co najmniej 3 wierzchołków")
+    if max_ear is not None and max_ear < 2:
+        raise ValueError("max_ear musi wynosić co najmniej 2")
+    rng = np.random.default_rng(seed)
+    n = nodes_num
+    if extra_cycles is None:
+        extra_cycles = n // 2
+    if max_ear is None:
+        max_ear = max(2, int(np.sqrt(n)))
+
+    order = rng.permutation(n).tolist()
+    first = min(n, int(rng.integers(3, max_ear + 2)))
+    if n - first == 1:
+        first = n  # pojedynczy pozostały wierzchołek włączamy do cyklu początkowego
+    cycle = order[:first]
+    edges = list(zip(cycle, cycle[1:] + cycle[:1]))
+
+    # Zamknięte uszy: istniejący wierzchołek -> nowe wierzchołki -> ten sam wierzchołek
+    placed = first
+    while placed < n:
+        length = min(n - placed, int(rng.integers(1, max_ear + 1)))
+        new = order[placed : placed + length]
+        if length == 1:
+            # Podział losowej krawędzi (x, y) na ścieżkę x - v - y
+            i = int(rng.integers(len(edges)))
+            x, y = edges[i]
+            edges[i] = (x, new[0])
+            edges.append((new[0], y))
+        else:
+            anchor = order[int(rng.integers(placed))]
+            ear = [anchor] + new
+            edges.extend(zip(ear, ear[1:] + ear[:1]))
+        placed += length
+
+    # Dodatkowe krótkie (3-6 krawędzi) losowe cykle na istniejących wierzchołkach
+    existing = {min(u, v) * n + max(u, v) for u, v in edges}
+    max_cycle = min(n, 6)
+    attempts = 0
+    added = 0
+    while added < extra_cycles and attempts < 4 * extra_cycles:
+        attempts += 1
+        vertices = rng.integers(0, n, int(rng.integers(3, max_cycle + 1))).tolist()
+        if len(set(vertices)) != len(vertices):
+            continue
+        keys = [
+            min(u, v) * n + max(u, v) for u, v in zip(vertices, vertices[1:] + vertices[:1])
+        ]
+        if any(key in existing for key in keys):
+            continue
+        existing.update(keys)
+        edges.extend(zip(vertices, vertices[1:] + vertices[:1]))
+        added += 1
+
+    edges = np.array(edges, dtype=np.int64)
+    if as_array:
+        return edges
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(edges.tolist())
+    return G
+
+
 def fleury_euler_graph(G):
     """
     Algorytm Fleury'ego do znalezienia cyklu Eulera w grafie.
@@ -60,15 +145,82 @@ def fleury_euler_graph(G):
     return path
 
 
+def hierholzer_euler_circuit(G):
+    """
+    Algorytm Hierholzera (iteracyjny) do znalezienia cyklu Eulera w czasie O(n + m).
+    Krawędzie trzymane są w tablicach z listą incydencji w formacie CSR,
+    wskaźnikiem bieżącej krawędzi dla każdego wierzchołka i mapą użytych krawędzi,
+    więc każda krawędź jest oglądana stałą liczbę razy.
+
+    :param G: graf NetworkX lub tablica krawędzi o kształcie (m, 2) z wierzchołkami 0..n-1
+    :return: cykl Eulera jako tablica NumPy wierzchołków (pusta, jeśli graf nie jest eulerowski)
+    """
+    if isinstance(G, nx.Graph):
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        m = G.number_of_edges()
+        ends = np.fromiter(
+            (index[x] for edge in G.edges() for x in edge), dtype=np.int64, count=2 * m
+        ).reshape(m, 2)
+        n = len(nodes)
+    else:
+        ends = np.asarray(G, dtype=np.int64).reshape(-1, 2)
+        m = len(ends)
+        n = int(ends.max()) + 1 if m else 0
+        nodes = None
+
+    if m == 0:
+        print("Graf nie jest eulerowski!")
+        return np.zeros(0, dtype=np.int64)
+
+    # Lista incydencji: dla wierzchołka u numery krawędzi incident[indptr[u]:indptr[u + 1]]
+    endpoints = ends.T.ravel()
+    order = np.argsort(endpoints, kind="stable")
+    incident = (order % m).tolist()
+    degree = np.bincount(endpoints, minlength=n)
+    if (degree % 2).any():
+        print("Graf nie jest eulerowski!")
+        return np.zeros(0, dtype=np.int64)
+    indptr = np.concatenate(([0], np.cumsum(degree))).tolist()
+    other = (ends[:, 0] ^ ends[:, 1]).tolist()  # drugi koniec krawędzi e: other[e] ^ u
+
+    pointer = indptr[:-1]
+    used = bytearray(m)
+    stack = [int(np.argmax(degree > 0))]
+    circuit = []
+
+    while stack:
+        u = stack[-1]
+        p, end = pointer[u], indptr[u + 1]
+        while p < end and used[incident[p]]:
+            p += 1
+        if p == end:
+            pointer[u] = p
+            circuit.append(stack.pop())
+        else:
+            e = incident[p]
+            pointer[u] = p + 1
+            used[e] = 1
+            stack.append(other[e] ^ u)
+
+    # Niewykorzystane krawędzie oznaczają graf niespójny
+    if len(circuit) != m + 1:
+        print("Graf nie jest eulerowski!")
+        return np.zeros(0, dtype=np.int64)
+
+    circuit = np.array(circuit[::-1], dtype=np.int64)
+    return circuit if nodes is None else np.array(nodes)[circuit]
+
+
 def main():
     """
     Główna funkcja programu – generuje graf Eulerowski, rysuje go i znajduje cykl Eulera.
     """
-    G = generating_euler_graph(8)
+    G = generate_euler_graph_fast(8, seed=None)
 
     draw_circle_graph(G, radius=10, name="euler_graph.png", weights=False)
 
-    path = fleury_euler_graph(G)
+    path = hierholzer_euler_circuit(G)
     print("Cykl Eulera:", path)
 
 
@@ -1,4 +1,6 @@
-import random
+import networkx as nx
+import numpy as np
+from project_1.disjoint_set import DisjointSet
 from project_1.generator import generate_random_graph_nl
 from project_1.draw_graph import draw_circle_graph
 
@@ -18,6 +20,123 @@ def generate_and_draw_graph(n_nodes, n_edges, name_before):
     return G
 
 
+def _component_count(edges_u, edges_v, n):
+    """Liczba składowych spójności (bez wierzchołków izolowanych) wyznaczona strukturą union-find."""
+    sets = DisjointSet(n)
+    for u, v in zip(edges_u, edges_v):
+        sets.union(u, v)
+    isolated = n - len(set(edges_u).union(edges_v))
+    return sets.count - isolated
+
+
+def rewire_edges(G, swaps, seed=None, batch_size=10000, connected=False, max_attempts=None):
+    """
+    Losowe przełączanie krawędzi z zachowaniem stopni wierzchołków.
+
+    Krawędzie trzymane są w indeksowanych tablicach (losowanie krawędzi w O(1)),
+    a ich obecność sprawdzana w zbiorze haszującym, więc jedna zamiana
+    (a, b) + (c, d) -> (a, d) + (b, c) kosztuje O(1) i odbywa się w miejscu.
+    Propozycje zamian losowane są wektorowo w paczkach po batch_size.
+
+    :param G: graf NetworkX (modyfikowany w miejscu) lub tablica krawędzi (m, 2)
+    :param swaps: liczba skutecznych zamian do wykonania
+    :param seed: ziarno dla numpy.random.default_rng
+    :param batch_size: rozmiar paczki propozycji; przy connected=True także maksymalne
+        okno zamian, po którym sprawdzana jest spójność
+    :param connected: nie dopuszczaj do wzrostu liczby składowych spójności; okno,
+        które rozspójniło graf, jest wycofywane, a kolejne okno jest dwa razy mniejsze
+    :param max_attempts: limit prób (domyślnie 10 * swaps)
+    :return: (graf lub tablica krawędzi, słownik ze statystykami akceptacji)
+    """
+    rng = np.random.default_rng(seed)
+    if isinstance(G, nx.Graph):
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        edges_u = [index[u] for u, _ in G.edges()]
+        edges_v = [index[v] for _, v in G.edges()]
+        n = len(nodes)
+    else:
+        edges = np.asarray(G, dtype=np.int64).reshape(-1, 2)
+        edges_u, edges_v = edges[:, 0].tolist(), edges[:, 1].tolist()
+        n = int(edges.max()) + 1 if edges.size else 0
+
+    m = len(edges_u)
+    if max_attempts is None:
+        max_attempts = 10 * swaps
+    stats = {
+        "attempts": 0,
+        "accepted": 0,
+        "rejected_loop": 0,
+        "rejected_multi_edge": 0,
+        "rolled_back": 0,
+    }
+
+    def key(u, v):
+        # Klucz krawędzi nieskierowanej niezależny od kolejności końców
+        return u * n + v if u < v else v * n + u
+
+    present = {key(u, v) for u, v in zip(edges_u, edges_v)}
+    original = set(present)
+    base_components = _component_count(edges_u, edges_v, n) if connected else 0
+    window = batch_size
+
+    while m >= 2 and stats["accepted"] < swaps and stats["attempts"] < max_attempts:
+        size = min(window, max_attempts - stats["attempts"])
+        first = rng.integers(m, size=size).tolist()
+        second = rng.integers(m, size=size).tolist()
+        flips = rng.integers(4, size=size).tolist()
+        log = []
+
+        for i, j, flip in zip(first, second, flips):
+            if stats["accepted"] >= swaps:
+                break
+            stats["attempts"] += 1
+            a, b = (edges_u[i], edges_v[i]) if flip & 1 else (edges_v[i], edges_u[i])
+            c, d = (edges_u[j], edges_v[j]) if flip & 2 else (edges_v[j], edges_u[j])
+
+            if a == d or b == c:
+                stats["rejected_loop"] += 1
+                continue
+            key_ad, key_bc = key(a, d), key(b, c)
+            if key_ad in present or key_bc in present:
+                stats["rejected_multi_edge"] += 1
+                continue
+
+            present.discard(key(a, b))
+            present.discard(key(c, d))
+            present.add(key_ad)
+            present.add(key_bc)
+            if connected:
+                log.append((i, j, edges_u[i], edges_v[i], edges_u[j], edges_v[j]))
+            edges_u[i], edges_v[i] = a, d
+            edges_u[j], edges_v[j] = b, c
+            stats["accepted"] += 1
+
+        if connected and log:
+            if _component_count(edges_u, edges_v, n) > base_components:
+                # Wycofanie całego okna w odwrotnej kolejności
+                for i, j, ui, vi, uj, vj in reversed(log):
+                    present.discard(key(edges_u[i], edges_v[i]))
+                    present.discard(key(edges_u[j], edges_v[j]))
+                    present.add(key(ui, vi))
+                    present.add(key(uj, vj))
+                    edges_u[i], edges_v[i], edges_u[j], edges_v[j] = ui, vi, uj, vj
+                stats["accepted"] -= len(log)
+                stats["rolled_back"] += len(log)
+                window = max(1, window // 2)
+            else:
+                window = min(batch_size, window * 2)
+
+    stats["acceptance_rate"] = stats["accepted"] / max(stats["attempts"], 1)
+
+    if isinstance(G, nx.Graph):
+        # Tylko różnica zbiorów krawędzi - niezamienione krawędzie zachowują atrybuty
+        G.remove_edges_from((nodes[k // n], nodes[k % n]) for k in original - present)
+        G.add_edges_from((nodes[k // n], nodes[k % n]) for k in present - original)
+        return G, stats
+    return np.column_stack((edges_u, edges_v)).astype(np.int64), stats
+
+
 def randomize_edges(G, randomizations):
     """
     Funkcja losowo modyfikuje krawędzie w grafie, przeprowadzając dokładnie `randomizations` skutecznych zamian.
@@ -28,41 +147,16 @@ def randomize_edges(G, randomizations):
     :param randomizations: liczba zamian krawędzi
     :return: zmodyfikowany graf
     """
-    successful_swaps = 0
-    max_attempts = randomizations * 10
-    attempts = 0
-
-    # Pętla wykonująca zamiany krawędzi
-    while successful_swaps < randomizations and attempts < max_attempts:
-        attempts += 1
-
-        edges = list(G.edges())
-        if len(edges) < 2:
-            break
-
-        random_edge_1 = random.choice(edges)
-        random_edge_2 = random.choice(edges)
-
-        u1, v1 = random_edge_1
-        u2, v2 = random_edge_2
-
-        a, b = random.choice([(u1, v1), (v1, u1)])
-        c, d = random.choice([(u2, v2), (v2, u2)])
-
-        if a != d and b != c and not G.has_edge(a, d) and not G.has_edge(b, c):
-            G.remove_edge(a, b)
-            G.remove_edge(c, d)
-            G.add_edge(a, d)
-            G.add_edge(b, c)
-
-            successful_swaps += 1
-            print(
-                f"[{successful_swaps}] Zamieniono: ({a}, {b}) + ({c}, {d}) → ({a}, {d}) + ({b}, {c})"
-            )
-
-    if successful_swaps < randomizations:
+    G, stats = rewire_edges(G, randomizations)
+
+    print(
+        f"Wykonano {stats['accepted']} zamian w {stats['attempts']} próbach "
+        f"(odrzucone: pętle {stats['rejected_loop']}, "
+        f"krawędzie wielokrotne {stats['rejected_multi_edge']})."
+    )
+    if stats["accepted"] < randomizations:
         print(
-            f"Ostrzeżenie: Wykonano tylko {successful_swaps} z {randomizations} zamian."
+            f"Ostrzeżenie: Wykonano tylko {stats['accepted']} z {randomizations} zamian."
         )
 
     return G
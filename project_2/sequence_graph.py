@@ -1,4 +1,5 @@
 import networkx as nx
+import numpy as np
 from project_1.draw_graph import draw_circle_graph
 
 
@@ -52,6 +53,106 @@ def build_graph(sequence):
     return G
 
 
+def _degree_array(sequence):
+    """Zamienia ciąg stopni na tablicę NumPy; None, jeśli ciąg na pewno nie jest graficzny."""
+    d = np.asarray(sequence, dtype=np.int64).ravel()
+    n = d.size
+    if n and (d.min() < 0 or d.max() >= n or d.sum() % 2):
+        return None
+    return d
+
+
+def erdos_gallai(sequence):
+    """
+    Sprawdza, czy ciąg jest graficzny, na podstawie nierówności Erdősa-Gallaia:
+    dla każdego k suma k największych stopni <= k(k-1) + suma_{i>k} min(d_i, k).
+    Sortowanie przez zliczanie i sumy prefiksowe NumPy dają czas O(n).
+    """
+    d = _degree_array(sequence)
+    if d is None:
+        return False
+    n = d.size
+    if n == 0:
+        return True
+
+    counts = np.bincount(d, minlength=n)
+    d_sorted = np.repeat(np.arange(n - 1, -1, -1), counts[::-1])  # nierosnąco
+    prefix = np.concatenate(([0], np.cumsum(d_sorted)))
+    # at_least[k] - liczba stopni >= k
+    at_least = np.concatenate((np.cumsum(counts[::-1])[::-1], [0]))
+
+    k = np.arange(1, n + 1)
+    p = at_least[k]
+    # Pozycje k+1..max(k, p) mają stopień >= k i wnoszą k; dalsze wnoszą swój stopień
+    split = np.maximum(k, p)
+    rhs = k * (k - 1) + k * (split - k) + (prefix[n] - prefix[split])
+    return bool(np.all(prefix[1:] <= rhs))
+
+
+def havel_hakimi_buckets(sequence, as_array=False):
+    """
+    Konstruuje graf o zadanym ciągu stopni algorytmem Havel-Hakimi
+    z kubełkami stopni zamiast ponownego sortowania.
+    Kubełek k przechowuje wierzchołki o pozostałym stopniu k; wierzchołek
+    o największym stopniu łączy się z wierzchołkami z najwyższych kubełków,
+    a te przechodzą do kubełka o jeden niższego. Czas działania O(n + m).
+
+    :param sequence: ciąg stopni
+    :param as_array: zwróć tablicę krawędzi (m, 2) zamiast nx.Graph
+    :raises ValueError: jeśli ciąg nie jest graficzny
+    """
+    d = _degree_array(sequence)
+    if d is None:
+        raise ValueError("Nieprawidłowy ciąg graficzny")
+    n = d.size
+    degrees = d.tolist()
+
+    buckets = [[] for _ in range(max(n, 1))]
+    for v, deg in enumerate(degrees):
+        if deg > 0:
+            buckets[deg].append(v)
+
+    tails, heads = [], []
+    top = len(buckets) - 1
+    while True:
+        while top > 0 and not buckets[top]:
+            top -= 1
+        if top == 0:
+            break
+
+        v = buckets[top].pop()
+        need = top
+        chosen = []  # pary (stopień przed połączeniem, wierzchołki)
+        k = top
+        while need:
+            while k > 0 and not buckets[k]:
+                k -= 1
+            if k == 0:
+                raise ValueError("Nieprawidłowy ciąg graficzny")
+            take = min(need, len(buckets[k]))
+            chosen.append((k, buckets[k][-take:]))
+            del buckets[k][-take:]
+            need -= take
+            k -= 1
+
+        # Przeniesienie wybranych wierzchołków do niższych kubełków dopiero po wyborze
+        for k, group in chosen:
+            if k > 1:
+                buckets[k - 1].extend(group)
+            heads.extend(group)
+        tails.extend([v] * top)
+
+    edges = np.column_stack(
+        (np.array(tails, dtype=np.int64), np.array(heads, dtype=np.int64))
+    )
+    if as_array:
+        return edges
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(edges.tolist())
+    return G
+
+
 def main():
     """
     Główna funkcja programu – sprawdza czy ciąg jest graficzny,
@@ -59,9 +160,9 @@ def main():
     """
     ciag = [4, 2, 4, 2, 2, 1]
 
-    if havel_hakimi(ciag):
+    if erdos_gallai(ciag):
         print("Ciąg jest graficzny.")
-        graf = build_graph(ciag)
+        graf = havel_hakimi_buckets(ciag)
         draw_circle_graph(graf, radius=10, name="generated_graph.png", weights=False)
     else:
         print("Ciąg NIE jest graficzny.")
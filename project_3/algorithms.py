@@ -1,26 +1,95 @@
-def dijkstra(graph_matrix, start):
-    """Implementacja algorytmu Dijkstry na podstawie macierzy sąsiedztwa."""
-    n = len(graph_matrix)
-    visited = set()
-    distances = [float("inf")] * n
+import heapq
+
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+from project_1.disjoint_set import DisjointSet
+
+
+def as_csr(graph):
+    """
+    Zamienia graf na CSRGraph: macierz sąsiedztwa (0 = brak krawędzi)
+    lub listę sąsiedztwa {wierzchołek: [(sąsiad, waga), ...]}.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph
+    if isinstance(graph, dict):
+        return CSRGraph.from_adjacency_list(graph)
+    return CSRGraph.from_adjacency_matrix(graph)
+
+
+def shortest_paths(graph, start, target=None, max_distance=None):
+    """
+    Algorytm Dijkstry z kopcem binarnym (leniwe usuwanie zamiast decrease-key).
+
+    Parametry:
+        graph: CSRGraph, macierz sąsiedztwa lub lista sąsiedztwa.
+        start (int): Wierzchołek początkowy.
+        target (int lub None): Wierzchołek docelowy - obliczenia kończą się
+            w chwili jego zdjęcia z kopca.
+        max_distance (float lub None): Wierzchołki dalsze niż max_distance
+            nie są odwiedzane.
+
+    Zwraca:
+        tuple: (distances, predecessors) jako tablice NumPy. Wierzchołki
+        nieosiągnięte (lub nierozstrzygnięte przy wczesnym zakończeniu) mają
+        odległość inf i poprzednika -1.
+    """
+    graph = as_csr(graph)
+    n = len(graph)
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    inf = float("inf")
+    limit = inf if max_distance is None else max_distance
+
+    distances = [inf] * n
+    predecessors = [-1] * n
+    settled = bytearray(n)
     distances[start] = 0
+    heap = [(0, start)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if settled[u]:
+            continue  # nieaktualny wpis w kopcu
+        settled[u] = 1
+        if u == target:
+            break
+
+        a, b = indptr[u], indptr[u + 1]
+        for v, weight in zip(indices[a:b].tolist(), weights[a:b].tolist()):
+            nd = d + weight
+            if nd < distances[v] and nd <= limit:
+                distances[v] = nd
+                predecessors[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    distances = np.array(distances, dtype=np.float64)
+    predecessors = np.array(predecessors, dtype=np.int64)
+    if target is not None:
+        # Odległości wierzchołków nierozstrzygniętych są tylko górnymi oszacowaniami
+        unsettled = np.frombuffer(bytes(settled), dtype=np.uint8) == 0
+        distances[unsettled] = inf
+        predecessors[unsettled] = -1
+    return distances, predecessors
+
+
+def reconstruct_path(predecessors, start, target):
+    """
+    Odtwarza najkrótszą ścieżkę start -> target na podstawie tablicy poprzedników.
+    Zwraca pustą listę, jeśli target jest nieosiągalny.
+    """
+    if target != start and predecessors[target] == -1:
+        return []
+    path = [target]
+    while path[-1] != start:
+        path.append(int(predecessors[path[-1]]))
+    path.reverse()
+    return path
 
-    while len(visited) < n:
-        # Wybór nieodwiedzonego wierzchołka o najmniejszym obecnym dystansie
-        current = min(
-            (node for node in range(n) if node not in visited),
-            key=lambda node: distances[node],
-        )
-        visited.add(current)
-
-        # Aktualizacja dystansów do sąsiadów
-        for neighbor, weight in enumerate(graph_matrix[current]):
-            if weight > 0 and neighbor not in visited:
-                distances[neighbor] = min(
-                    distances[neighbor], distances[current] + weight
-                )
 
-    return distances
+def dijkstra(graph_matrix, start):
+    """Implementacja algorytmu Dijkstry na podstawie macierzy sąsiedztwa lub grafu CSR."""
+    return shortest_paths(graph_matrix, start)[0].tolist()
 
 
 def convert_adjecency_matrix_to_edges_list(graph_matrix):
@@ -45,65 +114,116 @@ def convert_edges_list_to_adjecency_matrix(edges_list, n):
     return graph_matrix
 
 
-def kruskal(graph_matrix):
-    """Implementacja algorytmu Kruskala na podstawie macierzy sąsiedztwa."""
-    # Tworzenie zbiorów jednowierzchołkowych dla każdego wierzchołka
-    sets = [{node} for node in range(len(graph_matrix))]
+def convert_mst_edges(mst_edges, graph):
+    """Zwraca drzewo rozpinające w tej samej reprezentacji co graf wejściowy."""
+    n = len(graph)
+    if isinstance(graph, CSRGraph):
+        src, dst, weights = zip(*mst_edges) if mst_edges else ((), (), ())
+        return CSRGraph.from_edges(src, dst, weights, n=n, labels=graph.labels)
+    return convert_edges_list_to_adjecency_matrix(mst_edges, n)
+
+
+def edge_arrays(graph):
+    """Zwraca krawędzie grafu nieskierowanego jako tablice NumPy (src, dst, weights)."""
+    if isinstance(graph, CSRGraph):
+        return graph.edges()
+    matrix = np.asarray(graph)
+    src, dst = np.nonzero(np.triu(matrix, 1))
+    return src, dst, matrix[src, dst]
+
 
-    # Pobranie i posortowanie wszystkich krawędzi po wadze
-    edges = convert_adjecency_matrix_to_edges_list(graph_matrix)
-    edges.sort(key=lambda edge: edge[2])
+def kruskal_edges(src, dst, weights, n, presorted=False):
+    """
+    Algorytm Kruskala na tablicach krawędzi ze strukturą zbiorów rozłącznych.
+
+    Parametry:
+        src, dst, weights (np.ndarray): Krawędzie grafu nieskierowanego.
+        n (int): Liczba wierzchołków.
+        presorted (bool): Czy krawędzie są już posortowane rosnąco po wagach.
+
+    Zwraca:
+        np.ndarray: Indeksy krawędzi należących do minimalnego lasu rozpinającego.
+    """
+    if presorted:
+        order = np.arange(len(weights))
+    else:
+        order = np.argsort(weights, kind="stable")
+
+    sets = DisjointSet(n)
     mst = []
+    needed = n - 1
+
+    for e, i, j in zip(order.tolist(), src[order].tolist(), dst[order].tolist()):
+        if sets.union(i, j):
+            mst.append(e)
+            # Drzewo rozpinające ma n-1 krawędzi - pozostałych nie trzeba sprawdzać
+            if len(mst) == needed:
+                break
 
-    for i, j, weight in edges:
-        # Znalezienie zbiorów, do których należą oba wierzchołki
-        set_i = next((s for s in sets if i in s), None)
-        set_j = next((s for s in sets if j in s), None)
+    return np.array(mst, dtype=np.int64)
 
-        # Jeśli wierzchołki są w różnych zbiorach — dodaj krawędź do MST i połącz zbiory
-        if set_i != set_j:
-            mst.append((i, j, weight))
-            sets.remove(set_i)
-            sets.remove(set_j)
-            sets.append(set_i.union(set_j))
 
-    return convert_edges_list_to_adjecency_matrix(mst, len(graph_matrix))
+def kruskal(graph_matrix):
+    """Implementacja algorytmu Kruskala na podstawie macierzy sąsiedztwa lub grafu CSR."""
+    src, dst, weights = edge_arrays(graph_matrix)
+    chosen = kruskal_edges(src, dst, weights, len(graph_matrix))
+    mst = list(zip(src[chosen].tolist(), dst[chosen].tolist(), weights[chosen].tolist()))
+    return convert_mst_edges(mst, graph_matrix)
 
 
 def prim(graph_matrix):
-    """Implementacja algorytmu Prima na podstawie macierzy sąsiedztwa."""
-    n = len(graph_matrix)
-    in_mst = [False] * n  # czy wierzchołek jest już w MST
+    """
+    Implementacja algorytmu Prima z kopcem binarnym na listach sąsiedztwa (CSR).
+    Dla grafu niespójnego zwraca minimalny las rozpinający.
+    """
+    graph = as_csr(graph_matrix)
+    n = len(graph)
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    in_mst = bytearray(n)  # czy wierzchołek jest już w MST
     key = [float("inf")] * n  # najniższy koszt dotarcia do danego wierzchołka
     parent = [-1] * n  # rodzic danego wierzchołka w MST
-    key[0] = 0  # zaczynamy od wierzchołka 0
 
-    for _ in range(n):
-        # Wybór wierzchołka spoza MST z minimalnym kosztem dotarcia
-        u = min((i for i in range(n) if not in_mst[i]), key=lambda i: key[i])
-        in_mst[u] = True
-
-        # Aktualizacja kosztów dotarcia dla sąsiadów
-        for v in range(n):
-            if 0 < graph_matrix[u][v] < key[v] and not in_mst[v]:
-                key[v] = graph_matrix[u][v]
-                parent[v] = u
+    for root in range(n):
+        if in_mst[root]:
+            continue
+        key[root] = 0
+        heap = [(0, root)]
+
+        while heap:
+            # Wybór wierzchołka spoza MST z minimalnym kosztem dotarcia
+            _, u = heapq.heappop(heap)
+            if in_mst[u]:
+                continue
+            in_mst[u] = 1
+
+            # Aktualizacja kosztów dotarcia dla sąsiadów
+            a, b = indptr[u], indptr[u + 1]
+            for v, weight in zip(indices[a:b].tolist(), weights[a:b].tolist()):
+                if weight < key[v] and not in_mst[v]:
+                    key[v] = weight
+                    parent[v] = u
+                    heapq.heappush(heap, (weight, v))
 
     # Tworzenie listy krawędzi MST na podstawie tablicy parent
-    mst_edges = [
-        (parent[v], v, graph_matrix[parent[v]][v])
-        for v in range(1, n)
-        if parent[v] != -1
-    ]
+    if isinstance(graph_matrix, CSRGraph):
+        mst_edges = [(parent[v], v, key[v]) for v in range(n) if parent[v] != -1]
+    else:
+        mst_edges = [
+            (parent[v], v, graph_matrix[parent[v]][v])
+            for v in range(n)
+            if parent[v] != -1
+        ]
 
-    return convert_edges_list_to_adjecency_matrix(mst_edges, n)
+    return convert_mst_edges(mst_edges, graph_matrix)
 
 
 def graph_center(paths_matrix):
     """Zwraca wierzchołek centrum grafu (minimalna suma odległości do pozostałych)."""
-    return min(range(len(paths_matrix)), key=lambda node: sum(paths_matrix[node]))
+    paths_matrix = np.asarray(paths_matrix)
+    return int(np.argmin(paths_matrix.sum(axis=1, dtype=np.float64)))
 
 
 def graph_center_minmax(paths_matrix):
     """Zwraca wierzchołek centrum grafu minmax (minimalna największa odległość do pozostałych)."""
-    return min(range(len(paths_matrix)), key=lambda node: max(paths_matrix[node]))
+    paths_matrix = np.asarray(paths_matrix)
+    return int(np.argmin(paths_matrix.max(axis=1)))
@@ -0,0 +1,101 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+from project_1.graph_file import mmap_source, open_mmap_source
+from project_3.algorithms import as_csr, shortest_paths
+
+
+def distance_matrix(graph):
+    """
+    Tworzy macierz odległości float32 (inf - brak krawędzi, 0 na przekątnej)
+    z macierzy sąsiedztwa (0 = brak krawędzi) lub grafu CSR.
+    """
+    if isinstance(graph, CSRGraph):
+        n = len(graph)
+        D = np.full((n, n), np.inf, dtype=np.float32)
+        src, dst, weights = graph.edges()
+        # Przy krawędziach wielokrotnych zostaje najmniejsza waga
+        np.minimum.at(D, (src, dst), weights.astype(np.float32))
+        if not graph.directed:
+            np.minimum.at(D, (dst, src), weights.astype(np.float32))
+    else:
+        D = np.array(graph, dtype=np.float32)
+        D[D == 0] = np.inf
+    np.fill_diagonal(D, 0)
+    return D
+
+
+def floyd_warshall(graph):
+    """
+    Algorytm Floyda-Warshalla w NumPy.
+
+    Każdy krok k to jedna operacja wektorowa min(D, D[:, k] + D[k, :]).
+
+    Parametry:
+        graph: Macierz sąsiedztwa (0 = brak krawędzi) lub CSRGraph.
+
+    Zwraca:
+        np.ndarray: Macierz n x n najkrótszych odległości (float32).
+    """
+    D = distance_matrix(graph)
+    for k in range(len(D)):
+        np.minimum(D, D[:, k, None] + D[k, None, :], out=D)
+    return D
+
+
+_worker_graph = None
+
+
+def _init_worker(indptr, indices, weights, directed):
+    global _worker_graph
+    # Tablice mapowane z pliku przekazywane są jako opis (ścieżka, przesunięcie, ...)
+    indptr, indices, weights = (
+        open_mmap_source(a) if isinstance(a, tuple) else a for a in (indptr, indices, weights)
+    )
+    _worker_graph = CSRGraph(indptr, indices, weights, directed)
+
+
+def _distance_rows(sources, graph=None):
+    graph = _worker_graph if graph is None else graph
+    rows = np.empty((len(sources), len(graph)), dtype=np.float32)
+    for i, source in enumerate(sources):
+        rows[i] = shortest_paths(graph, source)[0]
+    return rows
+
+
+def multi_source_dijkstra(graph, sources=None, workers=None, chunk_size=64):
+    """
+    Wyznacza odległości z wielu źródeł, uruchamiając algorytm Dijkstry
+    dla każdego źródła; źródła są rozdzielane między procesy ProcessPoolExecutor.
+
+    Parametry:
+        graph: CSRGraph, macierz sąsiedztwa lub lista sąsiedztwa.
+        sources (iterable lub None): Źródła (domyślnie wszystkie wierzchołki).
+        workers (int lub None): Liczba procesów (None lub 1 - bieżący proces).
+        chunk_size (int): Liczba źródeł przetwarzanych w jednym zadaniu.
+
+    Zwraca:
+        np.ndarray: Macierz float32 len(sources) x n; wiersz i zawiera
+        odległości od sources[i].
+    """
+    graph = as_csr(graph)
+    n = len(graph)
+    sources = np.arange(n) if sources is None else np.asarray(sources)
+    chunks = [
+        sources[i : i + chunk_size].tolist() for i in range(0, len(sources), chunk_size)
+    ]
+
+    if not workers or workers <= 1:
+        results = [_distance_rows(chunk, graph) for chunk in chunks]
+    else:
+        # Graf wczytany przez load_csr nie jest kopiowany - procesy mapują ten sam plik
+        arrays = (graph.indptr, graph.indices, graph.weights)
+        initargs = (*(mmap_source(a) or a for a in arrays), graph.directed)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+            results = list(pool.map(_distance_rows, chunks))
+
+    if not results:
+        return np.zeros((0, n), dtype=np.float32)
+    return np.concatenate(results)
@@ -0,0 +1,144 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from project_1.shared_arrays import SharedArrays, attach_arrays
+from project_3.algorithms import edge_arrays, convert_mst_edges
+
+
+def _cheapest_edges(comp_src, comp_dst, ranks, n, sentinel):
+    """
+    Dla każdej składowej wyznacza rangę najtańszej krawędzi wychodzącej.
+    Składowe bez krawędzi wychodzącej dostają wartość sentinel.
+    """
+    best = np.full(n, sentinel, dtype=np.int64)
+    np.minimum.at(best, comp_src, ranks)
+    np.minimum.at(best, comp_dst, ranks)
+    return best
+
+
+# Stan procesów roboczych: tablice krawędzi podpięte do pamięci współdzielonej
+_worker_state = None
+
+
+def _init_worker(specs):
+    global _worker_state
+    _worker_state = attach_arrays(specs)
+
+
+def _cheapest_edges_range(a, b, n, sentinel):
+    comp_src, comp_dst, ranks = _worker_state[1][0]
+    return _cheapest_edges(comp_src[a:b], comp_dst[a:b], ranks[a:b], n, sentinel)
+
+
+def _cheapest_edges_parallel(executor, workers, size, n, sentinel):
+    """
+    Wersja równoległa: procesy czytają pierwsze size krawędzi z pamięci
+    współdzielonej, dostając tylko zakresy indeksów; wyniki łączone są minimum.
+    """
+    bounds = np.linspace(0, size, workers + 1).astype(np.int64).tolist()
+    futures = [
+        executor.submit(_cheapest_edges_range, a, b, n, sentinel)
+        for a, b in zip(bounds[:-1], bounds[1:])
+        if b > a
+    ]
+    return np.minimum.reduce([future.result() for future in futures])
+
+
+def boruvka_edges(src, dst, weights, n, workers=None):
+    """
+    Algorytm Borůvki na tablicach krawędzi.
+
+    W każdej rundzie każda składowa wybiera najtańszą krawędź wychodzącą
+    (np.minimum.at po numerach składowych), a składowe są łączone przez
+    skakanie po wskaźnikach. Rund jest co najwyżej log2(n), a każda jest
+    w całości operacją wektorową, którą można rozdzielić między procesy.
+
+    Parametry:
+        src, dst, weights (np.ndarray): Krawędzie grafu nieskierowanego.
+        n (int): Liczba wierzchołków.
+        workers (int lub None): Liczba procesów dla fazy wyboru najtańszych
+            krawędzi (None lub 1 - obliczenia w bieżącym procesie). Krawędzie
+            trafiają raz do pamięci współdzielonej, a w każdej rundzie proces
+            główny nadpisuje w niej tylko krawędzie wciąż łączące składowe.
+
+    Zwraca:
+        np.ndarray: Indeksy krawędzi należących do minimalnego lasu rozpinającego.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    m = len(weights)
+
+    # Ranga krawędzi = pozycja w porządku (waga, indeks) - porządek ściśle liniowy,
+    # więc przy równych wagach wybrane krawędzie nie utworzą cyklu
+    order = np.lexsort((np.arange(m), weights))
+    ranks = np.empty(m, dtype=np.int64)
+    ranks[order] = np.arange(m)
+
+    nodes = np.arange(n, dtype=np.int64)
+    comp = nodes.copy()
+    e_src, e_dst, e_rank = src, dst, ranks
+    chosen = []
+
+    executor, shared = None, None
+    try:
+        if workers and workers > 1 and m:
+            # Wiersze bufora: składowe początków, składowe końców i rangi krawędzi
+            shared = SharedArrays([np.zeros((3, m), dtype=np.int64)])
+            executor = ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(shared.specs,)
+            )
+
+        while True:
+            comp_src, comp_dst = comp[e_src], comp[e_dst]
+            # Krawędzie wewnątrz składowych nie będą już potrzebne
+            outgoing = comp_src != comp_dst
+            if not outgoing.all():
+                e_src, e_dst, e_rank = e_src[outgoing], e_dst[outgoing], e_rank[outgoing]
+                comp_src, comp_dst = comp_src[outgoing], comp_dst[outgoing]
+            if e_rank.size == 0:
+                break
+
+            if executor is None:
+                best = _cheapest_edges(comp_src, comp_dst, e_rank, n, m)
+            else:
+                size = e_rank.size
+                for row, values in enumerate((comp_src, comp_dst, e_rank)):
+                    shared.arrays[0][row, :size] = values
+                best = _cheapest_edges_parallel(executor, workers, size, n, m)
+
+            has_edge = np.nonzero(best < m)[0]
+            chosen.append(np.unique(best[has_edge]))
+
+            # Każda składowa wskazuje składową po drugiej stronie swojej krawędzi
+            edges = order[best[has_edge]]
+            a, b = comp[src[edges]], comp[dst[edges]]
+            target = nodes.copy()
+            target[has_edge] = np.where(a == has_edge, b, a)
+
+            # Pary wskazujących się nawzajem składowych - mniejszy numer zostaje korzeniem
+            mutual = (target[target] == nodes) & (target != nodes) & (nodes < target)
+            target[mutual] = nodes[mutual]
+            while True:
+                jumped = target[target]
+                if np.array_equal(jumped, target):
+                    break
+                target = jumped
+            comp = target[comp]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if shared is not None:
+            shared.close()
+
+    if not chosen:
+        return np.zeros(0, dtype=np.int64)
+    return np.sort(order[np.concatenate(chosen)])
+
+
+def boruvka(graph_matrix, workers=None):
+    """Implementacja algorytmu Borůvki na podstawie macierzy sąsiedztwa lub grafu CSR."""
+    src, dst, weights = edge_arrays(graph_matrix)
+    chosen = boruvka_edges(src, dst, weights, len(graph_matrix), workers)
+    mst = list(zip(src[chosen].tolist(), dst[chosen].tolist(), weights[chosen].tolist()))
+    return convert_mst_edges(mst, graph_matrix)
@@ -0,0 +1,100 @@
+import numpy as np
+
+from project_3.algorithms import as_csr, shortest_paths
+
+
+def _bounded_eccentricities(graph, center_only):
+    """
+    Wspólny silnik metody ograniczeń (Takes, Kosters) dla grafu nieskierowanego.
+
+    Po uruchomieniu Dijkstry z wierzchołka v o ekscentryczności e(v)
+    dla każdego w zachodzi max(d(v, w), e(v) - d(v, w)) <= e(w) <= e(v) + d(v, w).
+    Wierzchołki, dla których ograniczenia się zrównały (lub które nie mogą
+    już być centrum przy center_only), są pomijane. Źródła wybierane są
+    naprzemiennie: największe ograniczenie górne i najmniejsze dolne.
+    """
+    graph = as_csr(graph)
+    if graph.directed:
+        raise ValueError("Graph must be undirected")
+    n = len(graph)
+    lower = np.zeros(n, dtype=np.float64)
+    upper = np.full(n, np.inf, dtype=np.float64)
+    candidates = np.ones(n, dtype=bool)
+    pick_upper = True
+
+    while candidates.any():
+        if pick_upper:
+            v = int(np.argmax(np.where(candidates, upper, -np.inf)))
+        else:
+            v = int(np.argmin(np.where(candidates, lower, np.inf)))
+        pick_upper = not pick_upper
+
+        distances = shortest_paths(graph, v)[0]
+        ecc = distances.max()
+        if ecc == np.inf:
+            raise ValueError("Graph must be connected")
+
+        np.maximum(lower, np.maximum(distances, ecc - distances), out=lower)
+        np.minimum(upper, ecc + distances, out=upper)
+        lower[v] = upper[v] = ecc
+
+        candidates &= lower < upper
+        if center_only:
+            candidates &= lower <= upper.min()
+
+    return lower, upper
+
+
+def eccentricities(graph):
+    """
+    Wyznacza dokładne ekscentryczności wszystkich wierzchołków spójnego grafu
+    nieskierowanego bez budowania macierzy odległości (pamięć O(n + m)).
+    Zwykle wystarcza niewielka liczba przebiegów Dijkstry zamiast n.
+    """
+    return _bounded_eccentricities(graph, center_only=False)[1]
+
+
+def eccentricity_center(graph):
+    """
+    Zwraca centrum minmax (wierzchołek o najmniejszej ekscentryczności).
+    Wierzchołki, których dolne ograniczenie przekracza najlepsze znane górne,
+    są odrzucane bez wyznaczania dokładnej ekscentryczności.
+    """
+    lower, upper = _bounded_eccentricities(graph, center_only=True)
+    settled = lower >= upper
+    return int(np.argmin(np.where(settled, upper, np.inf)))
+
+
+def approximate_closeness(graph, samples, seed=None):
+    """
+    Przybliżona bliskość (closeness centrality) na podstawie losowej próbki źródeł
+    (estymator Eppsteina-Wanga). Odległości są sumowane strumieniowo, więc
+    pamięć wynosi O(n) niezależnie od liczby źródeł.
+
+    Parametry:
+        graph: CSRGraph, macierz sąsiedztwa lub lista sąsiedztwa (nieskierowany).
+        samples (int): Liczba losowanych źródeł (co najmniej 1).
+        seed: Ziarno dla numpy.random.default_rng.
+
+    Zwraca:
+        np.ndarray: Oszacowanie bliskości (n - 1) / suma_odległości dla każdego wierzchołka.
+    """
+    if samples < 1:
+        raise ValueError("samples must be at least 1")
+    graph = as_csr(graph)
+    n = len(graph)
+    rng = np.random.default_rng(seed)
+    sources = rng.choice(n, size=min(samples, n), replace=False)
+
+    totals = np.zeros(n, dtype=np.float64)
+    for source in sources.tolist():
+        totals += shortest_paths(graph, source)[0]
+
+    estimated = totals * n / len(sources)
+    with np.errstate(divide="ignore"):
+        return (n - 1) / estimated
+
+
+def approximate_center(graph, samples, seed=None):
+    """Zwraca wierzchołek o największej przybliżonej bliskości (centrum sumy odległości)."""
+    return int(np.argmax(approximate_closeness(graph, samples, seed)))
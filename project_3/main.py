@@ -8,6 +8,7 @@ from project_3.algorithms import (
     graph_center,
     graph_center_minmax,
 )
+from project_3.apsp import multi_source_dijkstra
 
 if __name__ == "__main__":
 
@@ -25,11 +26,11 @@ if __name__ == "__main__":
     print(dijkstra(graph_matrix, 0))
 
     # Zadanie 3: Obliczenie macierzy najkrótszych ścieżek między wszystkimi parami wierzchołków
-    paths_matrix = [dijkstra(graph_matrix, node) for node in range(len(graph_matrix))]
+    paths_matrix = multi_source_dijkstra(graph_matrix)
     print("Macierz najkrótszych ścieżek:")
     for i in paths_matrix:
         print(
-            i, sum(i), max(i)
+            i, i.sum(), i.max()
         )  # wypisanie ścieżek z danego wierzchołka, ich sumy i maksymalnej wartości
 
     # Zadanie 4: Wyznaczenie centrum grafu (minimalna suma odległości) i centrum minmax (minimalna największa odległość)
@@ -1,100 +1,218 @@
 import math
 import heapq
-from typing import List, Tuple, Optional
+from collections import deque
+from typing import List, Tuple, Optional, Union
 
-# Algorytm Kosaraju do znajdowania silnie spójnych składowych grafu skierowanego
+import numpy as np
 
+from project_1.csr_graph import CSRGraph
+from project_4.scc import kosaraju_scc
 
-def kosaraju(adj: List[List[int]]) -> List[int]:
-    """
-    Znajduje silnie spójne składowe grafu skierowanego.
-    adj: macierz sąsiedztwa, gdzie adj[u][v] != 0 oznacza krawędź z u do v.
-    Zwraca listę comp, gdzie comp[v] to numer składowej (liczone od 1).
-    """
-    n = len(adj)
-    visited = [False] * n
-    stack = []
+Graph = Union[List[List[Optional[float]]], CSRGraph]
 
-    def dfs1(u: int):
-        visited[u] = True
-        for v in range(n):
-            if adj[u][v] != 0 and not visited[v]:
-                dfs1(v)
-        stack.append(u)
 
-    # Pierwsze przejście: porządek kończenia przeszukiwania
-    for u in range(n):
-        if not visited[u]:
-            dfs1(u)
+def _weighted_successors(w: Graph, u: int) -> List[Tuple[int, float]]:
+    """Zwraca pary (następnik, waga); None/math.inf w macierzy oznacza brak krawędzi."""
+    if isinstance(w, CSRGraph):
+        return list(zip(w.neighbors(u).tolist(), w.neighbor_weights(u).tolist()))
+    return [
+        (v, weight)
+        for v, weight in enumerate(w[u])
+        if weight is not None and weight != math.inf
+    ]
 
-    # Transpozycja grafu
-    adj_T = [[0] * n for _ in range(n)]
-    for u in range(n):
-        for v in range(n):
-            if adj[u][v] != 0:
-                adj_T[v][u] = adj[u][v]
-
-    # Drugie przejście: przypisanie składowych
-    comp = [0] * n
-    current_comp = 0
 
-    def dfs2(u: int):
-        comp[u] = current_comp
-        for v in range(n):
-            if adj_T[u][v] != 0 and comp[v] == 0:
-                dfs2(v)
+# Algorytm Kosaraju do znajdowania silnie spójnych składowych grafu skierowanego
 
-    while stack:
-        u = stack.pop()
-        if comp[u] == 0:
-            current_comp += 1
-            dfs2(u)
 
-    return comp
+def kosaraju(adj: Graph) -> List[int]:
+    """
+    Znajduje silnie spójne składowe grafu skierowanego.
+    adj: macierz sąsiedztwa, gdzie adj[u][v] != 0 oznacza krawędź z u do v,
+    lub graf CSRGraph.
+    Zwraca listę comp, gdzie comp[v] to numer składowej (liczone od 1).
+    Przeszukiwanie jest iteracyjne (project_4.scc), więc nie ogranicza go limit rekurencji.
+    """
+    return (kosaraju_scc(adj) + 1).tolist()
 
 
 # Algorytm Bellmana-Forda do znajdowania najkrótszych ścieżek z jednego źródła
-def bellman_ford(w: List[List[Optional[float]]], s: int) -> Tuple[bool, List[float]]:
+def bellman_ford(w: Graph, s: int) -> Tuple[bool, List[float]]:
     """
     Oblicza najkrótsze ścieżki z wierzchołka s w grafie skierowanym z wagami.
-    w[u][v] = waga krawędzi z u do v lub math.inf/None jeśli brak krawędzi.
+    w[u][v] = waga krawędzi z u do v lub math.inf/None jeśli brak krawędzi;
+    zamiast macierzy można podać graf CSRGraph.
     Zwraca (brak_ujemnego_cyklu, lista_odległości).
     Jeśli istnieje cykl o ujemnej wadze dostępny z s, zwraca (False, odległości).
     """
+    if isinstance(w, CSRGraph):
+        no_cycle, dist, _ = bellman_ford_vectorized(w, s)
+        return no_cycle, dist.tolist()
+
     n = len(w)
     dist = [math.inf] * n
     dist[s] = 0
 
+    # Lista krawędzi budowana raz zamiast przeglądania macierzy w każdej rundzie
+    edges = [(u, v, weight) for u in range(n) for v, weight in _weighted_successors(w, u)]
+
     # Relaksacja krawędzi n-1 razy
     for _ in range(n - 1):
         updated = False
-        for u in range(n):
-            for v in range(n):
-                weight = w[u][v]
-                if weight is not None and weight != math.inf:
-                    if dist[u] + weight < dist[v]:
-                        dist[v] = dist[u] + weight
-                        updated = True
+        for u, v, weight in edges:
+            if dist[u] + weight < dist[v]:
+                dist[v] = dist[u] + weight
+                updated = True
         if not updated:
             break
 
     # Sprawdzenie cykli ujemnych
-    for u in range(n):
-        for v in range(n):
-            weight = w[u][v]
-            if weight is not None and weight != math.inf:
-                if dist[u] + weight < dist[v]:
-                    return False, dist
+    for u, v, weight in edges:
+        if dist[u] + weight < dist[v]:
+            return False, dist
     return True, dist
 
 
+def _as_weighted_csr(w: Graph) -> CSRGraph:
+    """Zamienia macierz wag (None/math.inf = brak krawędzi, 0 to poprawna waga) na CSRGraph."""
+    if isinstance(w, CSRGraph):
+        return w
+    return CSRGraph.from_adjacency_matrix(w, directed=True, missing=None)
+
+
+def _predecessor_cycle(pred: np.ndarray, start: Optional[int] = None) -> Optional[List[int]]:
+    """
+    Szuka cyklu w grafie poprzedników (każdy wierzchołek ma co najwyżej jeden).
+    Jeśli podano start, sprawdzana jest tylko ścieżka poprzedników od start.
+    Zwraca cykl w kierunku krawędzi [v0, v1, ..., vk] (vk -> v0) lub None.
+    """
+    pred = pred.tolist() if isinstance(pred, np.ndarray) else pred
+    n = len(pred)
+    stamp = [-1] * n
+    for root in range(n) if start is None else [start]:
+        v = root
+        while v != -1 and stamp[v] == -1:
+            stamp[v] = root
+            v = pred[v]
+        if v != -1 and stamp[v] == root:
+            cycle = [v]
+            u = pred[v]
+            while u != v:
+                cycle.append(u)
+                u = pred[u]
+            cycle.reverse()
+            return cycle
+    return None
+
+
+def _cycle_node(pred: np.ndarray) -> int:
+    """
+    Wektorowo sprawdza, czy graf poprzedników zawiera cykl (podwajanie wskaźników).
+    Zwraca dowolny wierzchołek leżący na cyklu lub -1.
+    """
+    n = len(pred)
+    jump = np.append(np.where(pred < 0, n, pred), n)  # n - wartownik dla korzeni
+    steps = 1
+    while steps <= n:
+        jump = jump[jump]
+        steps *= 2
+    on_cycle = np.nonzero(jump[:n] != n)[0]
+    return int(jump[on_cycle[0]]) if on_cycle.size else -1
+
+
+def bellman_ford_vectorized(
+    w: Graph, s: int
+) -> Tuple[bool, np.ndarray, Optional[List[int]]]:
+    """
+    Algorytm Bellmana-Forda na tablicach krawędzi z relaksacją wektorową.
+    W każdej rundzie wszystkie krawędzie są relaksowane naraz przez
+    np.minimum.at po wierzchołkach docelowych; obliczenia kończą się,
+    gdy runda nie zmieni żadnej odległości lub gdy w grafie poprzedników
+    pojawi się cykl (zawsze jest to cykl ujemny).
+    Zwraca (brak_ujemnego_cyklu, tablica_odległości, cykl), gdzie cykl to lista
+    wierzchołków ujemnego cyklu osiągalnego z s (lub None).
+    """
+    graph = _as_weighted_csr(w)
+    n = len(graph)
+    src, dst, weights = graph.arcs()
+    dist = np.full(n, math.inf)
+    dist[s] = 0
+    pred = np.full(n, -1, dtype=np.int64)
+
+    # Bez ujemnego cyklu odległości ustalają się po co najwyżej n-1 rundach.
+    # Cykl w grafie poprzedników oznacza cykl ujemny, więc jest sprawdzany co rundę,
+    # aby nie czekać n rund; limit 2n rund to jedynie zabezpieczenie.
+    for _ in range(2 * n):
+        candidate = dist[src] + weights
+        better = np.nonzero(candidate < dist[dst])[0]
+        if better.size == 0:
+            return True, dist, None
+        np.minimum.at(dist, dst[better], candidate[better])
+        winners = better[candidate[better] == dist[dst[better]]]
+        pred[dst[winners]] = src[winners]
+
+        node = _cycle_node(pred)
+        if node != -1:
+            return False, dist, _predecessor_cycle(pred, node)
+
+    return False, dist, _predecessor_cycle(pred)
+
+
+def spfa(w: Graph, s: int) -> Tuple[bool, np.ndarray, Optional[List[int]]]:
+    """
+    Bellman-Ford w wersji kolejkowej (SPFA): relaksowane są tylko krawędzie
+    wychodzące z wierzchołków, których odległość się zmieniła (kolejka FIFO).
+    Ujemny cykl jest wykrywany, gdy ścieżka do wierzchołka liczy n krawędzi
+    albo gdy okresowe sprawdzenie znajdzie cykl w grafie poprzedników.
+    Zwraca (brak_ujemnego_cyklu, tablica_odległości, cykl).
+    """
+    graph = _as_weighted_csr(w)
+    n = len(graph)
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    dist = [math.inf] * n
+    dist[s] = 0
+    pred = [-1] * n
+    length = [0] * n  # liczba krawędzi na bieżącej ścieżce do wierzchołka
+    in_queue = bytearray(n)
+    queue = deque([s])
+    in_queue[s] = 1
+    relaxations = 0
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        du = dist[u]
+        a, b = indptr[u], indptr[u + 1]
+        for v, weight in zip(indices[a:b].tolist(), weights[a:b].tolist()):
+            nd = du + weight
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                length[v] = length[u] + 1
+                if length[v] >= n:
+                    cycle = _predecessor_cycle(pred, v) or _predecessor_cycle(pred)
+                    return False, np.array(dist), cycle
+                # Co n relaksacji szukamy cyklu w grafie poprzedników (koszt zamortyzowany O(1))
+                relaxations += 1
+                if relaxations == n:
+                    relaxations = 0
+                    cycle = _predecessor_cycle(pred)
+                    if cycle is not None:
+                        return False, np.array(dist), cycle
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    queue.append(v)
+
+    return True, np.array(dist), None
+
+
 # Algorytm Dijkstry dla grafów o nieujemnych wagach
 
 
-def dijkstra(w: List[List[Optional[float]]], src: int) -> List[float]:
+def dijkstra(w: Graph, src: int) -> List[float]:
     """
     Oblicza najkrótsze ścieżki z wierzchołka src w grafie z nieujemnymi wagami.
-    w[u][v] = waga lub math.inf/None jeśli brak krawędzi.
+    w[u][v] = waga lub math.inf/None jeśli brak krawędzi; można też podać CSRGraph.
     Zwraca listę odległości.
     """
     n = len(w)
@@ -106,13 +224,11 @@ def dijkstra(w: List[List[Optional[float]]], src: int) -> List[float]:
         d, u = heapq.heappop(pq)
         if d > dist[u]:
             continue
-        for v in range(n):
-            weight = w[u][v]
-            if weight is not None and weight != math.inf:
-                nd = d + weight
-                if nd < dist[v]:
-                    dist[v] = nd
-                    heapq.heappush(pq, (nd, v))
+        for v, weight in _weighted_successors(w, u):
+            nd = d + weight
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
     return dist
 
 
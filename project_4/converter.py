@@ -1,5 +1,8 @@
 import networkx as nx
 
+from project_1.csr_graph import CSRGraph
+from project_1.graph_file import save_csr
+
 
 def convert_digraph_to_adjacency_matrix(digraph, weights=False):
     """
@@ -40,3 +43,30 @@ def convert_adjacency_matrix_to_digraph(adjacency_matrix, weights=False):
                     digraph.add_edge(i, j)
 
     return digraph
+
+
+def convert_adjacency_matrix_to_file(adjacency_matrix, path, weights=False):
+    """
+    Zapisuje macierz sąsiedztwa grafu skierowanego do binarnego pliku CSR
+    (project_1.graph_file), który można wczytać bez kopiowania przez load_csr.
+    :param adjacency_matrix: macierz sąsiedztwa (przy weights=True None oznacza brak krawędzi)
+    :param path: ścieżka pliku
+    :return: zapisany graf CSR
+    """
+    graph = CSRGraph.from_adjacency_matrix(
+        adjacency_matrix, directed=True, missing=None if weights else 0
+    )
+    save_csr(graph, path)
+    return graph
+
+
+def convert_digraph_to_file(digraph, path, weights=False):
+    """
+    Zapisuje graf skierowany do binarnego pliku CSR.
+    :param digraph: graf skierowany
+    :param path: ścieżka pliku
+    :return: zapisany graf CSR
+    """
+    graph = CSRGraph.from_networkx(digraph, weight="weight" if weights else None)
+    save_csr(graph, path)
+    return graph
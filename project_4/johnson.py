@@ -0,0 +1,133 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+from project_1.shared_arrays import SharedArrays, attach_arrays
+from project_3.algorithms import shortest_paths
+from project_4.algorithms import Graph, _as_weighted_csr, bellman_ford_vectorized
+
+# Algorytm Johnsona dla dużych grafów rzadkich: potencjały liczone raz,
+# graf przeskalowany w CSR, Dijkstry równolegle na współdzielonej pamięci
+
+
+def johnson_potentials(w: Graph) -> np.ndarray:
+    """
+    Oblicza potencjały h algorytmu Johnsona przy pomocy rzadkiego Bellmana-Forda
+    z dodatkowego wierzchołka połączonego krawędziami o wadze 0 ze wszystkimi.
+    Potencjały można zapisać i używać wielokrotnie dla tego samego grafu.
+    Rzuca wyjątek jeśli istnieje cykl o ujemnej wadze.
+    """
+    graph = _as_weighted_csr(w)
+    n = len(graph)
+    src, dst, weights = graph.arcs()
+    extended = CSRGraph.from_edges(
+        np.concatenate((src, np.full(n, n))),
+        np.concatenate((dst, np.arange(n))),
+        np.concatenate((weights, np.zeros(n))),
+        n=n + 1,
+        directed=True,
+    )
+    has_no_cycle, h, _ = bellman_ford_vectorized(extended, n)
+    if not has_no_cycle:
+        raise ValueError("Graf zawiera cykl o ujemnej wadze")
+    return h[:n]
+
+
+def reweight(w: Graph, h: np.ndarray) -> CSRGraph:
+    """
+    Zwraca graf CSR z wagami w_hat(u, v) = w(u, v) + h[u] - h[v] (nieujemnymi).
+    Struktura indptr/indices jest współdzielona z grafem wejściowym.
+    """
+    graph = _as_weighted_csr(w)
+    src, dst, weights = graph.arcs()
+    # Błędy zaokrągleń nie mogą dać ujemnych wag dla Dijkstry
+    w_hat = np.maximum(weights + h[src] - h[dst], 0)
+    return CSRGraph(graph.indptr, graph.indices, w_hat, directed=True)
+
+
+# Stan procesów roboczych: tablice grafu podpięte do pamięci współdzielonej
+_worker_state = None
+
+
+def _init_worker(specs):
+    global _worker_state
+    blocks, (indptr, indices, weights, h) = attach_arrays(specs)
+    _worker_state = (blocks, CSRGraph(indptr, indices, weights, directed=True), h)
+
+
+def _johnson_rows(sources, state=None):
+    _, graph, h = _worker_state if state is None else state
+    rows = np.empty((len(sources), len(graph)), dtype=np.float64)
+    for i, u in enumerate(sources):
+        # Dijkstra z kopcem na tablicach CSR (project_3)
+        d_hat = shortest_paths(graph, u)[0]
+        rows[i] = d_hat - h[u] + h
+    return sources, rows
+
+
+def johnson_parallel(
+    w: Graph,
+    workers: Optional[int] = None,
+    h: Optional[np.ndarray] = None,
+    callback: Optional[Callable[[int, np.ndarray], None]] = None,
+    out: Optional[str] = None,
+    chunk_size: int = 16,
+) -> Optional[np.ndarray]:
+    """
+    Oblicza najkrótsze ścieżki między wszystkimi parami wierzchołków algorytmem Johnsona.
+
+    Parametry:
+        w: Macierz wag (None/math.inf = brak krawędzi) lub CSRGraph.
+        workers: Liczba procesów (None lub 1 - bieżący proces). Tablice grafu
+            trafiają do pamięci współdzielonej, więc procesy ich nie kopiują;
+            tablice grafu wczytanego przez load_csr są mapowane z pliku.
+        h: Gotowe potencjały z johnson_potentials (pomija Bellmana-Forda).
+        callback: Funkcja callback(u, wiersz) wywoływana dla każdego wiersza D.
+        out: Ścieżka pliku .npy - wiersze zapisywane są do macierzy mapowanej w pamięci.
+        chunk_size: Liczba źródeł w jednym zadaniu.
+
+    Zwraca:
+        np.ndarray (lub np.memmap przy out) z macierzą D n x n; None, jeśli
+        podano tylko callback.
+    """
+    graph = _as_weighted_csr(w)
+    n = len(graph)
+    if h is None:
+        h = johnson_potentials(graph)
+    h = np.asarray(h, dtype=np.float64)
+    graph = reweight(graph, h)
+
+    if out is not None:
+        D = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=(n, n))
+    elif callback is None:
+        D = np.empty((n, n), dtype=np.float64)
+    else:
+        D = None
+
+    def consume(result):
+        sources, rows = result
+        for u, row in zip(sources, rows):
+            if D is not None:
+                D[u] = row
+            if callback is not None:
+                callback(u, row)
+
+    chunks = [list(range(i, min(i + chunk_size, n))) for i in range(0, n, chunk_size)]
+
+    if not workers or workers <= 1:
+        state = (None, graph, h)
+        for chunk in chunks:
+            consume(_johnson_rows(chunk, state))
+    else:
+        with SharedArrays((graph.indptr, graph.indices, graph.weights, h)) as shared:
+            with ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(shared.specs,)
+            ) as pool:
+                for result in pool.map(_johnson_rows, chunks):
+                    consume(result)
+
+    if isinstance(D, np.memmap):
+        D.flush()
+    return D
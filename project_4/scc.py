@@ -0,0 +1,155 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+
+# Silnie spójne składowe bez rekurencji (jawny stos), na grafie CSR.
+# Składowe numerowane są od 0 w porządku topologicznym grafu składowych:
+# krawędzie grafu składowych prowadzą zawsze od mniejszego numeru do większego.
+
+
+def _as_digraph(adj: Union[List[List[int]], CSRGraph]) -> CSRGraph:
+    """Zamienia macierz sąsiedztwa (adj[u][v] != 0 - krawędź) na skierowany CSRGraph."""
+    if isinstance(adj, CSRGraph):
+        return adj
+    return CSRGraph.from_adjacency_matrix(adj, directed=True)
+
+
+def tarjan_scc(adj: Union[List[List[int]], CSRGraph]) -> np.ndarray:
+    """
+    Algorytm Tarjana (jedno przejście DFS) w wersji iteracyjnej.
+    Zwraca tablicę labels, gdzie labels[v] to numer składowej v.
+    """
+    graph = _as_digraph(adj)
+    n = len(graph)
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    pointer = indptr[:-1]  # następna krawędź do przejrzenia dla każdego wierzchołka
+
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    labels = [-1] * n
+    counter = 0
+    found = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call_stack = [root]
+
+        while call_stack:
+            u = call_stack[-1]
+            p = pointer[u]
+            if p < indptr[u + 1]:
+                pointer[u] = p + 1
+                v = indices[p]
+                if index[v] == -1:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = 1
+                    call_stack.append(v)
+                elif on_stack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+                continue
+
+            # Wszystkie krawędzie u przejrzane - powrót z "wywołania"
+            call_stack.pop()
+            if call_stack and low[u] < low[call_stack[-1]]:
+                low[call_stack[-1]] = low[u]
+            if low[u] == index[u]:
+                while True:
+                    x = stack.pop()
+                    on_stack[x] = 0
+                    labels[x] = found
+                    if x == u:
+                        break
+                found += 1
+
+    # Tarjan znajduje składowe w odwrotnym porządku topologicznym
+    return found - 1 - np.array(labels, dtype=np.int64)
+
+
+def kosaraju_scc(adj: Union[List[List[int]], CSRGraph]) -> np.ndarray:
+    """
+    Algorytm Kosaraju w wersji iteracyjnej (dwa przejścia DFS z jawnym stosem).
+    Zwraca tablicę labels, gdzie labels[v] to numer składowej v.
+    """
+    graph = _as_digraph(adj)
+    n = len(graph)
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    pointer = indptr[:-1]
+    visited = bytearray(n)
+    order = []
+
+    # Pierwsze przejście: porządek kończenia przeszukiwania
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        call_stack = [root]
+        while call_stack:
+            u = call_stack[-1]
+            p, end = pointer[u], indptr[u + 1]
+            while p < end and visited[indices[p]]:
+                p += 1
+            if p < end:
+                v = indices[p]
+                pointer[u] = p + 1
+                visited[v] = 1
+                call_stack.append(v)
+            else:
+                pointer[u] = p
+                call_stack.pop()
+                order.append(u)
+
+    # Drugie przejście po grafie transponowanym w kolejności malejących czasów przetworzenia
+    transposed = graph.transpose()
+    indptr = transposed.indptr.tolist()
+    indices = transposed.indices.tolist()
+    labels = [-1] * n
+    current = 0
+    for root in reversed(order):
+        if labels[root] != -1:
+            continue
+        labels[root] = current
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for v in indices[indptr[u] : indptr[u + 1]]:
+                if labels[v] == -1:
+                    labels[v] = current
+                    stack.append(v)
+        current += 1
+
+    return np.array(labels, dtype=np.int64)
+
+
+def condensation(
+    adj: Union[List[List[int]], CSRGraph], labels: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, CSRGraph]:
+    """
+    Wyznacza silnie spójne składowe i graf składowych (DAG).
+    Wierzchołek i grafu składowych odpowiada składowej i, a numeracja składowych
+    jest porządkiem topologicznym tego grafu.
+    Zwraca (labels, dag).
+    """
+    graph = _as_digraph(adj)
+    if labels is None:
+        labels = tarjan_scc(graph)
+    k = int(labels.max()) + 1 if labels.size else 0
+
+    src, dst, _ = graph.arcs()
+    comp_src, comp_dst = labels[src], labels[dst]
+    between = comp_src != comp_dst
+    keys = np.unique(comp_src[between] * k + comp_dst[between])
+    dag = CSRGraph.from_edges(keys // k, keys % k, n=k, directed=True)
+    return labels, dag
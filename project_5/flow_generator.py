@@ -0,0 +1,143 @@
+import numpy as np  # Wektorowe losowanie krawędzi
+
+from project_1.generator import bernoulli_indices
+from project_5.flow_graph import ArrayFlowNetwork
+
+
+# ============================
+# GENEROWANIE DUŻEJ WARSTWOWEJ SIECI PRZEPŁYWOWEJ
+# ============================
+def _layer_widths(layers, width, rng):
+    """Szerokości warstw pośrednich: liczba, przedział (min, max) lub funkcja rng -> tablica."""
+    if callable(width):
+        widths = np.asarray(width(rng), dtype=np.int64)
+    elif np.ndim(width) == 0:
+        widths = np.full(layers, width, dtype=np.int64)
+    else:
+        low, high = width
+        widths = rng.integers(low, high + 1, size=layers)
+    if widths.shape != (layers,) or widths.min(initial=1) < 1:
+        raise ValueError("Każda warstwa musi mieć co najmniej jeden wierzchołek")
+    return widths
+
+
+def _between_layers(a, b, density, rng):
+    """
+    Krawędzie między warstwami o szerokościach a i b (numery lokalne).
+    Każda para pojawia się z prawdopodobieństwem density, a dodatkowo każdy
+    wierzchołek pierwszej warstwy dostaje łuk wychodzący, a drugiej - wchodzący,
+    co gwarantuje spójność od źródła do ujścia bez powtórzeń losowania.
+    """
+    keys = np.concatenate(
+        (
+            bernoulli_indices(a * b, density, rng),
+            np.arange(a) * b + rng.integers(b, size=a),  # Łuk wychodzący każdego u
+            rng.integers(a, size=b) * b + np.arange(b),  # Łuk wchodzący każdego v
+        )
+    )
+    # Usunięcie powtórzeń przez sortowanie (szybsze niż np.unique dla dużych tablic)
+    keys.sort()
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if keys.size else keys
+    return keys // b, keys % b
+
+
+def _contains(sorted_keys, values):
+    """Przynależność values do posortowanej tablicy (wyszukiwanie binarne zamiast np.isin)."""
+    pos = np.searchsorted(sorted_keys, values)
+    pos[pos == sorted_keys.size] = 0
+    return sorted_keys[pos] == values if sorted_keys.size else np.zeros(values.size, dtype=bool)
+
+
+def _extra_edges(count, n, keys, rng):
+    """
+    Losuje count krawędzi spoza struktury warstw (nie do źródła, nie z ujścia,
+    bez pętli, bez powtórzeń i bez krawędzi przeciwnych do istniejących).
+    Każdą wolną parę {u, v} można dodać jako u -> v dla u < v, więc dostępnych
+    jest n (n - 1) / 2 - len(keys) krawędzi; większe count daje ValueError.
+    """
+    available = n * (n - 1) // 2 - len(keys)
+    if count > available:
+        raise ValueError(f"Only {available} extra edges fit in the network, requested {count}")
+    keys = np.sort(keys)
+    chosen = np.zeros(0, dtype=np.int64)
+    for _ in range(100):
+        missing = count - chosen.size
+        if missing <= 0:
+            break
+        size = 2 * missing + 16
+        u = rng.integers(0, n - 1, size=size)  # Bez ujścia (n - 1)
+        v = rng.integers(1, n, size=size)  # Bez źródła (0)
+        drawn = u * n + v
+        drawn = drawn[(u != v) & ~_contains(keys, drawn) & ~_contains(keys, v * n + u)]
+        drawn = drawn[~np.isin(drawn, chosen) & ~np.isin(drawn % n * n + drawn // n, chosen)]
+        # Para u -> v i v -> u w tej samej próbce - zostaje pierwsza
+        _, first = np.unique(np.minimum(drawn, drawn % n * n + drawn // n), return_index=True)
+        chosen = np.concatenate((chosen, drawn[np.sort(first)][:missing]))
+
+    missing = count - chosen.size
+    if missing > 0:
+        # Sieć prawie pełna - losowanie bez zwracania spośród wszystkich wolnych par
+        u, v = np.triu_indices(n, 1)
+        free = u * n + v
+        free = free[~_contains(keys, free) & ~_contains(keys, v * n + u)]
+        taken = np.sort(np.concatenate((chosen, chosen % n * n + chosen // n)))
+        free = free[~_contains(taken, free)]
+        chosen = np.concatenate((chosen, rng.choice(free, missing, replace=False)))
+    return chosen
+
+
+def generate_layered_flow_network(
+    layers,
+    width=(2, 4),
+    density=0.5,
+    extra_edges=None,
+    capacity=(1, 10),
+    seed=None,
+    labels=True,
+):
+    """
+    Generuje warstwową sieć przepływową dowolnej wielkości (uogólnienie
+    generate_flow_network z project_5.main, bez ograniczenia 2 <= N <= 4).
+
+    Warstwa 0 to źródło, warstwa layers + 1 to ujście. Krawędzie między
+    kolejnymi warstwami losowane są wektorowo (każda para z prawdopodobieństwem
+    density); każdy wierzchołek ma łuk wchodzący z poprzedniej i wychodzący do
+    następnej warstwy, więc ujście jest osiągalne z każdego wierzchołka.
+    Sieć budowana jest od razu w ArrayFlowNetwork.
+
+    :param layers: liczba warstw pośrednich
+    :param width: szerokość warstwy - liczba, przedział (min, max) lub funkcja rng -> tablica
+    :param density: prawdopodobieństwo krawędzi między wierzchołkami kolejnych warstw
+    :param extra_edges: liczba krawędzi spoza struktury warstw (domyślnie 2 * layers);
+        ValueError, jeśli tyle wolnych par wierzchołków nie ma
+    :param capacity: przedział (min, max) przepustowości
+    :param seed: ziarno lub numpy.random.Generator
+    :param labels: etykiety "v0", "v1", ... jak w generate_flow_network (False - numery)
+    :return: (sieć ArrayFlowNetwork, lista warstw z etykietami wierzchołków)
+    """
+    if layers < 1:
+        raise ValueError("Sieć musi mieć co najmniej jedną warstwę pośrednią")
+    rng = np.random.default_rng(seed)
+    sizes = np.concatenate(([1], _layer_widths(layers, width, rng), [1]))
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    n = int(offsets[-1])
+
+    tails, heads = [], []
+    for i in range(layers + 1):
+        u, v = _between_layers(int(sizes[i]), int(sizes[i + 1]), density, rng)
+        tails.append(u + offsets[i])
+        heads.append(v + offsets[i + 1])
+    tails, heads = np.concatenate(tails), np.concatenate(heads)
+
+    if extra_edges is None:
+        extra_edges = 2 * layers
+    extra = _extra_edges(extra_edges, n, tails * n + heads, rng)
+    tails = np.concatenate((tails, extra // n))
+    heads = np.concatenate((heads, extra % n))
+
+    low, high = capacity
+    capacities = rng.integers(low, high + 1, size=tails.size)
+    names = [f"v{i}" for i in range(n)] if labels else list(range(n))
+    network = ArrayFlowNetwork.from_arrays(tails, heads, capacities, labels=names)
+    layer_nodes = [names[offsets[i] : offsets[i + 1]] for i in range(layers + 2)]
+    return network, layer_nodes
@@ -0,0 +1,258 @@
+from array import array  # Zwarte tablice liczb zamiast list obiektów
+
+import numpy as np  # Wektorowa budowa sieci z tablic krawędzi
+
+
+# ============================
+# SIEĆ PRZEPŁYWOWA NA TABLICACH
+# ============================
+class ArrayFlowNetwork:
+    """
+    Sieć przepływowa przechowywana w ciągłych tablicach (array.array).
+
+    Etykiety wierzchołków zamieniane są na numery 0..n-1 (labels / index).
+    Każda krawędź u -> v to para łuków: łuk 2k (u -> v, przepustowość c)
+    i łuk przeciwny 2k + 1 (v -> u, przepustowość 0), więc łuk przeciwny do e to e ^ 1.
+    Łuki wychodzące z u tworzą listę "forward star": first[u], next_arc[first[u]], ...
+    Przepływ i koszt są antysymetryczne: flow[e ^ 1] == -flow[e], cost[e ^ 1] == -cost[e].
+    Stopnie wejściowe i wyjściowe są liczone przy dodawaniu krawędzi (O(1)).
+    """
+
+    __slots__ = (
+        "labels",
+        "index",
+        "head",
+        "capacity",
+        "cost",
+        "flow",
+        "first",
+        "next_arc",
+        "in_deg",
+        "out_deg",
+    )
+
+    def __init__(self, typecode="q", cost_typecode="q"):
+        """
+        :param typecode: typ przepustowości - "q" (int64) lub "d" (float)
+        :param cost_typecode: typ kosztów - "q" (int64) lub "d" (float)
+        """
+        self.labels = []  # Numer -> etykieta
+        self.index = {}  # Etykieta -> numer
+        self.head = array("q")  # Koniec łuku
+        self.capacity = array(typecode)  # Przepustowość łuku (0 dla łuków przeciwnych)
+        self.cost = array(cost_typecode)  # Koszt jednostki przepływu na łuku
+        self.flow = array(typecode)  # Przepływ łuku
+        self.first = array("q")  # Pierwszy łuk wychodzący z wierzchołka (-1 - brak)
+        self.next_arc = array("q")  # Następny łuk z tego samego wierzchołka
+        self.in_deg = array("q")
+        self.out_deg = array("q")
+
+    # ----------------------------
+    # Budowa sieci
+    # ----------------------------
+    def add_node(self, label):
+        """Zwraca numer wierzchołka, dodając go, jeśli jeszcze nie istnieje."""
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+            self.first.append(-1)
+            self.in_deg.append(0)
+            self.out_deg.append(0)
+        return i
+
+    def _add_arc(self, tail, tip, capacity, cost):
+        self.head.append(tip)
+        self.capacity.append(capacity)
+        self.cost.append(cost)
+        self.flow.append(0)
+        self.next_arc.append(self.first[tail])
+        self.first[tail] = len(self.head) - 1
+
+    def add_edge(self, u, v, capacity, cost=0):
+        """
+        Dodaje krawędź skierowaną u -> v (wraz z łukiem przeciwnym) i zwraca jej łuk.
+        W odróżnieniu od FlowNetwork ponowne dodanie pary (u, v) tworzy łuk równoległy.
+        """
+        iu, iv = self.add_node(u), self.add_node(v)
+        self._add_arc(iu, iv, capacity, cost)
+        self._add_arc(iv, iu, 0, -cost)
+        self.out_deg[iu] += 1
+        self.in_deg[iv] += 1
+        return len(self.head) - 2
+
+    # ----------------------------
+    # Dostęp do struktury
+    # ----------------------------
+    def __len__(self):
+        return len(self.labels)
+
+    def __repr__(self):
+        return f"ArrayFlowNetwork(n={len(self.labels)}, m={self.number_of_edges()})"
+
+    def number_of_edges(self):
+        return len(self.head) // 2
+
+    def arcs(self, u):
+        """Generator łuków wychodzących z wierzchołka o numerze u (także przeciwnych)."""
+        e = self.first[u]
+        while e != -1:
+            yield e
+            e = self.next_arc[e]
+
+    def tail(self, e):
+        return self.head[e ^ 1]
+
+    def get_neighbors(self, u):
+        """Zwraca etykiety następników u (tylko krawędzie sieci, bez łuków przeciwnych)."""
+        i = self.index.get(u)
+        if i is None:
+            return []
+        return [self.labels[self.head[e]] for e in self.arcs(i) if not e & 1]
+
+    def get_capacity(self, u, v):
+        """Suma przepustowości krawędzi u -> v (0 jeśli nie istnieje)."""
+        iu, iv = self.index.get(u), self.index.get(v)
+        if iu is None or iv is None:
+            return 0
+        return sum(self.capacity[e] for e in self.arcs(iu) if not e & 1 and self.head[e] == iv)
+
+    def has_edge(self, u, v):
+        iu, iv = self.index.get(u), self.index.get(v)
+        if iu is None or iv is None:
+            return False
+        return any(not e & 1 and self.head[e] == iv for e in self.arcs(iu))
+
+    def in_degree(self, v):
+        """Liczba krawędzi wchodzących do v w O(1)."""
+        i = self.index.get(v)
+        return 0 if i is None else self.in_deg[i]
+
+    def out_degree(self, u):
+        """Liczba krawędzi wychodzących z u w O(1)."""
+        i = self.index.get(u)
+        return 0 if i is None else self.out_deg[i]
+
+    # ----------------------------
+    # Przepływ
+    # ----------------------------
+    def residual(self):
+        """Lista przepustowości rezydualnych capacity[e] - flow[e] dla wszystkich łuków."""
+        return [c - f for c, f in zip(self.capacity, self.flow)]
+
+    def set_residual(self, residual):
+        """Zapisuje przepływ wynikający z przepustowości rezydualnych (odwrotność residual)."""
+        for e, (c, r) in enumerate(zip(self.capacity, residual)):
+            self.flow[e] = c - r
+
+    def reset_flow(self):
+        for e in range(len(self.flow)):
+            self.flow[e] = 0
+
+    def flow_value(self, source):
+        """Wartość przepływu: suma przepływu na łukach wychodzących ze źródła."""
+        s = self.index[source]
+        return sum(self.flow[e] for e in self.arcs(s))
+
+    def total_cost(self):
+        """Koszt bieżącego przepływu (suma flow * cost po krawędziach sieci)."""
+        return sum(self.flow[e] * self.cost[e] for e in range(0, len(self.head), 2))
+
+    def edge_flows(self):
+        """Słownik (u, v) -> przepływ dla krawędzi sieci (łuki równoległe są sumowane)."""
+        flows = {}
+        for e in range(0, len(self.head), 2):
+            key = (self.labels[self.head[e ^ 1]], self.labels[self.head[e]])
+            flows[key] = flows.get(key, 0) + self.flow[e]
+        return flows
+
+    # ----------------------------
+    # Konwersje
+    # ----------------------------
+    @classmethod
+    def from_flow_network(cls, G):
+        """Tworzy sieć tablicową z FlowNetwork (słownik u -> {v: przepustowość})."""
+        capacities = [c for u in G.graph for c in G.graph[u].values()]
+        costs = getattr(G, "costs", {})
+        network = cls(
+            "q" if all(isinstance(c, int) for c in capacities) else "d",
+            "q" if all(isinstance(c, int) for c in costs.values()) else "d",
+        )
+        for u in G.graph:
+            for v, capacity in G.graph[u].items():
+                network.add_edge(u, v, capacity, costs.get((u, v), 0))
+        for node in G.nodes:
+            network.add_node(node)
+        return network
+
+    @classmethod
+    def from_arrays(cls, tails, heads, capacities, costs=None, labels=None):
+        """
+        Buduje sieć hurtowo z tablic krawędzi (numery wierzchołków 0..n-1) bez pętli
+        Pythona po krawędziach. Wynik jest taki sam jak przy kolejnych add_edge.
+        :param tails, heads: początki i końce krawędzi
+        :param capacities: przepustowości krawędzi
+        :param costs: koszty krawędzi (domyślnie 0)
+        :param labels: etykiety wierzchołków (domyślnie numery 0..n-1)
+        :return: ArrayFlowNetwork
+        """
+        tails = np.asarray(tails, dtype=np.int64)
+        heads = np.asarray(heads, dtype=np.int64)
+        capacities = np.asarray(capacities)
+        costs = np.zeros(tails.size, dtype=np.int64) if costs is None else np.asarray(costs)
+        if labels is None:
+            n = int(max(tails.max(initial=-1), heads.max(initial=-1))) + 1
+            labels = list(range(n))
+        n = len(labels)
+        typecode = "q" if capacities.dtype.kind in "iub" else "d"
+        cost_typecode = "q" if costs.dtype.kind in "iub" else "d"
+        dtypes = {"q": np.int64, "d": np.float64}
+
+        # Łuk 2k: tails[k] -> heads[k], łuk 2k + 1: przeciwny
+        arc_tail = np.column_stack((tails, heads)).ravel()
+        arc_head = np.column_stack((heads, tails)).ravel()
+        arc_capacity = np.column_stack((capacities, np.zeros_like(capacities))).ravel()
+        arc_cost = np.column_stack((costs, -costs)).ravel()
+
+        # Listy "forward star" jak przy add_edge: first[u] to ostatni dodany łuk u,
+        # next_arc prowadzi do wcześniej dodanych
+        m = arc_tail.size
+        order = np.lexsort((-np.arange(m), arc_tail))
+        next_arc = np.full(m, -1, dtype=np.int64)
+        same = arc_tail[order[1:]] == arc_tail[order[:-1]]
+        next_arc[order[:-1][same]] = order[1:][same]
+        first = np.full(n, -1, dtype=np.int64)
+        starts = np.ones(m, dtype=bool)
+        starts[1:] = ~same
+        first[arc_tail[order[starts]]] = order[starts]
+
+        def to_array(values, typecode):
+            return array(typecode, np.ascontiguousarray(values, dtype=dtypes[typecode]).tobytes())
+
+        network = cls(typecode, cost_typecode)
+        network.labels = list(labels)
+        network.index = {label: i for i, label in enumerate(network.labels)}
+        network.head = to_array(arc_head, "q")
+        network.capacity = to_array(arc_capacity, typecode)
+        network.cost = to_array(arc_cost, cost_typecode)
+        network.flow = array(typecode, bytes(m * network.flow.itemsize))
+        network.first = to_array(first, "q")
+        network.next_arc = to_array(next_arc, "q")
+        network.in_deg = to_array(np.bincount(heads, minlength=n), "q")
+        network.out_deg = to_array(np.bincount(tails, minlength=n), "q")
+        return network
+
+    def to_flow_network(self):
+        """
+        Zwraca FlowNetwork z przepustowościami krawędzi (łuki równoległe są sumowane,
+        koszt pochodzi z ostatniego z nich).
+        """
+        # Import leniwy - unika cyklicznego importu z project_5.main
+        from project_5.main import FlowNetwork
+
+        G = FlowNetwork()
+        G.nodes.update(self.labels)
+        for e in range(0, len(self.head), 2):
+            u, v = self.labels[self.head[e ^ 1]], self.labels[self.head[e]]
+            G.add_edge(u, v, G.graph.get(u, {}).get(v, 0) + self.capacity[e], self.cost[e])
+        return G
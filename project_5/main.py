@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt  # Do tworzenia wykresów
 import matplotlib
 import os  # Do tworzenia folderów
 import math  # Do rozmieszczania wierzchołków na okręgu
+import sys  # Do uruchamiania pliku jako skryptu
 
 # Ustawienie backendu, który pozwala zapisywać wykresy do plików
 matplotlib.use("Agg")
@@ -67,13 +68,18 @@ class FlowNetwork:
     def __init__(self):
         self.graph = {}  # Słownik: wierzchołek -> {sąsiad: przepustowość}
         self.nodes = set()  # Zbór wszystkich wierzchołków
+        self.in_degrees = {}  # Słownik: wierzchołek -> liczba poprzedników
+        self.costs = {}  # Słownik: (u, v) -> koszt przesłania jednostki przepływu
 
-    def add_edge(self, u, v, capacity):
+    def add_edge(self, u, v, capacity, cost=0):
         self.nodes.add(u)
         self.nodes.add(v)
         if u not in self.graph:
             self.graph[u] = {}
+        if v not in self.graph[u]:
+            self.in_degrees[v] = self.in_degrees.get(v, 0) + 1  # Nowy poprzednik v
         self.graph[u][v] = capacity  # Dodaje krawędź skierowaną z u do v z daną przepustowością
+        self.costs[(u, v)] = cost  # Koszt jednostki przepływu na krawędzi
 
     def get_neighbors(self, u):
         return self.graph.get(u, {}).keys()  # Zwraca sąsiadów danego wierzchołka
@@ -81,6 +87,9 @@ class FlowNetwork:
     def get_capacity(self, u, v):
         return self.graph[u].get(v, 0)  # Zwraca przepustowość krawędzi (0 jeśli nie istnieje)
 
+    def get_cost(self, u, v):
+        return self.costs.get((u, v), 0)  # Zwraca koszt krawędzi (0 jeśli nie podano)
+
     def set_capacity(self, u, v, capacity):
         self.graph[u][v] = capacity  # Ustawia nową przepustowość
 
@@ -88,7 +97,7 @@ class FlowNetwork:
         return v in self.graph.get(u, {})  # Sprawdza, czy istnieje krawędź
 
     def in_degree(self, v):
-        return sum(1 for u in self.graph if v in self.graph[u])  # Liczy ilu ma poprzedników
+        return self.in_degrees.get(v, 0)  # Liczba poprzedników (liczona w add_edge)
 
 # ============================
 # GENEROWANIE LOSOWEJ SIECI PRZEPŁYWOWEJ
@@ -219,22 +228,38 @@ def convert_to_networkx(G):
 # ============================
 # BLOK GŁÓWNY
 # ============================
-N = 3  # Liczba warstw pośrednich
-G, layers = generate_flow_network(N)  # Generujemy sieć
-source = layers[0][0]  # Źródło to pierwszy wierzchołek warstwy 0
-sink = layers[-1][0]  # Ujście to pierwszy wierzchołek ostatniej warstwy
+if __name__ == "__main__":
+    # Przy "python project_5/main.py" katalog repozytorium nie jest na ścieżce importu
+    if not __package__:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Szybsze algorytmy maksymalnego przepływu
+    from project_5.maxflow import dinic, push_relabel, IncrementalMaxFlow
+
+    N = 3  # Liczba warstw pośrednich
+    G, layers = generate_flow_network(N)  # Generujemy sieć
+    source = layers[0][0]  # Źródło to pierwszy wierzchołek warstwy 0
+    sink = layers[-1][0]  # Ujście to pierwszy wierzchołek ostatniej warstwy
+
+    G_nx = convert_to_networkx(G)  # Konwersja do networkx do rysowania
 
-G_nx = convert_to_networkx(G)  # Konwersja do networkx do rysowania
+    draw_circle_graph(G_nx, radius=10, name="sieć_z5.png", weights=True)  # Rysowanie i zapis grafu
+
+    # Wypisanie krawędzi i przepustowości
+    print("ZADANIE 1: Graf przepływowy (wierzchołki i krawędzie):")
+    for u in G.graph:
+        for v in G.graph[u]:
+            print(f"{u} -> {v} | capacity = {G.graph[u][v]}")
 
-draw_circle_graph(G_nx, radius=10, name="sieć_z5.png", weights=True)  # Rysowanie i zapis grafu
+    # Obliczenie maksymalnego przepływu i wypisanie ścieżek
+    print("\nZADANIE 2: Ścieżki powiększające:")
+    max_flow = ford_fulkerson(G, source, sink)
+    print(f"\nMaksymalny przepływ z {source} do {sink} wynosi: {max_flow}")
 
-# Wypisanie krawędzi i przepustowości
-print("ZADANIE 1: Graf przepływowy (wierzchołki i krawędzie):")
-for u in G.graph:
-    for v in G.graph[u]:
-        print(f"{u} -> {v} | capacity = {G.graph[u][v]}")
+    # Sprawdzenie wyniku szybszymi algorytmami
+    print(f"Algorytm Dinica: {dinic(G, source, sink)}")
+    print(f"Push-relabel: {push_relabel(G, source, sink)}")
 
-# Obliczenie maksymalnego przepływu i wypisanie ścieżek
-print("\nZADANIE 2: Ścieżki powiększające:")
-max_flow = ford_fulkerson(G, source, sink)
-print(f"\nMaksymalny przepływ z {source} do {sink} wynosi: {max_flow}")
+    # Minimalne cięcie z zachowanej sieci rezydualnej
+    solver = IncrementalMaxFlow(G, source, sink)
+    S, cut = solver.min_cut()
+    print(f"Minimalne cięcie: {', '.join(f'{u} -> {v}' for u, v in cut)}")
@@ -0,0 +1,410 @@
+from collections import deque  # Kolejka do BFS
+
+from project_5.flow_graph import ArrayFlowNetwork  # Sieć przepływowa na tablicach
+
+
+# ============================
+# SIEĆ REZYDUALNA NA TABLICACH
+# ============================
+# Silniki działają na sieci rezydualnej z ArrayFlowNetwork: łuk przeciwny do e to e ^ 1,
+# head[e] - koniec łuku, cap[e] - przepustowość rezydualna, first[u] / next_arc[e] -
+# lista łuków wychodzących z u ("forward star"; -1 oznacza koniec listy).
+
+
+def _as_array_network(G):
+    """Zwraca ArrayFlowNetwork dla FlowNetwork lub samą sieć, jeśli już jest tablicowa."""
+    if isinstance(G, ArrayFlowNetwork):
+        return G
+    return ArrayFlowNetwork.from_flow_network(G)
+
+
+def _residual_lists(network):
+    """Zwraca (n, head, cap, first, next_arc) jako listy - indeksowanie list jest najszybsze."""
+    return (
+        len(network),
+        network.head.tolist(),
+        network.residual(),
+        network.first.tolist(),
+        network.next_arc.tolist(),
+    )
+
+
+# ============================
+# ALGORYTM DINICA
+# ============================
+def _bfs_levels(n, head, cap, first, next_arc, s, t):
+    """
+    Poziomy (odległości od s) w sieci rezydualnej; -1 - nieosiągalny.
+    Przeszukiwanie kończy się na warstwie ujścia - dalsze warstwy nie leżą
+    na najkrótszych ścieżkach do t.
+    """
+    level = [-1] * n
+    level[s] = 0
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        if level[t] >= 0 and level[u] >= level[t]:
+            break
+        e = first[u]
+        while e != -1:
+            v = head[e]
+            if cap[e] > 0 and level[v] < 0:
+                level[v] = level[u] + 1
+                queue.append(v)
+            e = next_arc[e]
+    return level
+
+
+def _dinic(n, head, cap, first, next_arc, s, t, limit=float("inf")):
+    """
+    Algorytm Dinica na tablicach sieci rezydualnej (modyfikuje cap w miejscu).
+    Przepływ blokujący wyznaczany jest iteracyjnym DFS ze wskaźnikami bieżącego
+    łuku: łuk, który nie prowadzi do ujścia, nie jest w danej fazie sprawdzany ponownie.
+    Przerywa po przesłaniu limit jednostek przepływu. Zwraca przesłany przepływ.
+    """
+    flow = 0
+    while flow < limit:
+        level = _bfs_levels(n, head, cap, first, next_arc, s, t)
+        if level[t] < 0:
+            break
+        current = first[:]  # Bieżący łuk każdego wierzchołka
+        path = []  # Łuki ścieżki od s do u
+        u = s
+
+        while True:
+            if u == t:
+                # Przepływ wzdłuż ścieżki: minimum przepustowości (i pozostałego limitu)
+                pushed = min(min(cap[e] for e in path), limit - flow)
+                for e in path:
+                    cap[e] -= pushed
+                    cap[e ^ 1] += pushed
+                flow += pushed
+                if flow >= limit:
+                    break
+                # Cofnięcie do początku pierwszego nasyconego łuku
+                k = next(i for i, e in enumerate(path) if cap[e] == 0)
+                u = head[path[k] ^ 1]
+                del path[k:]
+                continue
+
+            e = current[u]
+            while e != -1 and (cap[e] == 0 or level[head[e]] != level[u] + 1):
+                e = next_arc[e]
+            current[u] = e
+
+            if e != -1:
+                path.append(e)
+                u = head[e]
+            elif u == s:
+                break
+            else:
+                # Ślepy zaułek: u usuwany z grafu warstwowego, powrót o jeden łuk
+                level[u] = -1
+                e = path.pop()
+                u = head[e ^ 1]
+                current[u] = next_arc[current[u]]
+
+    return flow
+
+
+def dinic(G, source, sink):
+    """
+    Maksymalny przepływ algorytmem Dinica (graf warstwowy + przepływ blokujący),
+    O(V^2 E) zamiast O(V E^2) dla Edmondsa-Karpa.
+    Dla ArrayFlowNetwork wynikowy przepływ zapisywany jest w tablicy flow sieci
+    (obliczenia startują od przepływu już w niej zapisanego).
+    :param G: sieć przepływowa (FlowNetwork lub ArrayFlowNetwork)
+    :param source: źródło
+    :param sink: ujście
+    :return: wartość maksymalnego przepływu (łącznie z przepływem zapisanym wcześniej)
+    """
+    network = _as_array_network(G)
+    if source == sink:
+        return 0
+    existing = network.flow_value(source)
+    n, head, cap, first, next_arc = _residual_lists(network)
+    flow = _dinic(n, head, cap, first, next_arc, network.index[source], network.index[sink])
+    network.set_residual(cap)
+    return existing + flow
+
+
+# ============================
+# PUSH-RELABEL (NAJWYŻSZA ETYKIETA)
+# ============================
+def _global_relabel(n, head, cap, first, next_arc, s, t, height):
+    """Ustawia wysokości na odległości do ujścia w sieci rezydualnej (BFS wstecz od t)."""
+    for v in range(n):
+        height[v] = n
+    height[t] = 0
+    queue = deque([t])
+    while queue:
+        v = queue.popleft()
+        e = first[v]
+        while e != -1:
+            u = head[e]
+            # u może pchać do v, jeśli łuk przeciwny u -> v ma przepustowość
+            if cap[e ^ 1] > 0 and height[u] == n and u != s:
+                height[u] = height[v] + 1
+                queue.append(u)
+            e = next_arc[e]
+    height[s] = n
+
+
+def _push_relabel(n, head, cap, first, next_arc, s, t):
+    """
+    Pierwsza faza algorytmu push-relabel z wyborem aktywnego wierzchołka
+    o najwyższej etykiecie oraz heurystykami luki (gap) i globalnego
+    przeetykietowania. Modyfikuje cap w miejscu i zwraca wartość
+    maksymalnego przepływu (nadmiar ujścia); nadmiary wierzchołków, które
+    nie mogą dotrzeć do ujścia, nie są zwracane do źródła.
+    """
+    height = [0] * n
+    excess = [0] * n
+    current = first[:]
+
+    # Nasycenie wszystkich łuków wychodzących ze źródła
+    e = first[s]
+    while e != -1:
+        c = cap[e]
+        if c > 0:
+            cap[e] = 0
+            cap[e ^ 1] += c
+            excess[head[e]] += c
+            excess[s] -= c
+        e = next_arc[e]
+
+    def rebuild():
+        _global_relabel(n, head, cap, first, next_arc, s, t, height)
+        buckets = [[] for _ in range(n)]
+        count = [0] * (n + 1)
+        for v in range(n):
+            if height[v] < n:
+                count[height[v]] += 1
+                if excess[v] > 0 and v != t:
+                    buckets[height[v]].append(v)
+        for v in range(n):
+            current[v] = first[v]
+        return buckets, count
+
+    buckets, count = rebuild()
+    highest = n - 1
+    relabels = 0
+
+    while highest >= 0:
+        if not buckets[highest]:
+            highest -= 1
+            continue
+        u = buckets[highest].pop()
+
+        # Rozładowanie u
+        while excess[u] > 0:
+            e = current[u]
+            if e == -1:
+                # Podniesienie: 1 + najniższy sąsiad osiągalny w sieci rezydualnej
+                old = height[u]
+                new = 2 * n
+                e = first[u]
+                while e != -1:
+                    if cap[e] > 0 and height[head[e]] < new:
+                        new = height[head[e]]
+                    e = next_arc[e]
+                new += 1
+                count[old] -= 1
+                relabels += 1
+
+                if count[old] == 0:
+                    # Luka: wierzchołki powyżej old nie mają już ścieżki do ujścia
+                    for v in range(n):
+                        if old < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n
+                    height[u] = n
+                    break
+                if new >= n:
+                    height[u] = n
+                    break
+
+                height[u] = new
+                count[new] += 1
+                current[u] = first[u]
+                continue
+
+            v = head[e]
+            if cap[e] > 0 and height[u] == height[v] + 1:
+                delta = excess[u] if excess[u] < cap[e] else cap[e]
+                cap[e] -= delta
+                cap[e ^ 1] += delta
+                excess[u] -= delta
+                if excess[v] == 0 and v != t and v != s:
+                    buckets[height[v]].append(v)
+                    # Po podniesieniu u wierzchołek v może leżeć wyżej niż dotychczasowe maksimum
+                    if height[v] > highest:
+                        highest = height[v]
+                excess[v] += delta
+            else:
+                current[u] = next_arc[e]
+
+        # Globalne przeetykietowanie po n podniesieniach
+        if relabels >= n:
+            relabels = 0
+            buckets, count = rebuild()
+            highest = n - 1
+
+    return excess[t]
+
+
+def push_relabel(G, source, sink):
+    """
+    Maksymalny przepływ algorytmem push-relabel (najwyższa etykieta,
+    heurystyki luki i globalnego przeetykietowania), O(V^2 sqrt(E)).
+    Wyznaczana jest tylko wartość przepływu - tablica flow sieci nie jest zmieniana.
+    Obliczenia startują od przepływu zapisanego w sieci, tak jak w dinic.
+    :param G: sieć przepływowa (FlowNetwork lub ArrayFlowNetwork)
+    :param source: źródło
+    :param sink: ujście
+    :return: wartość maksymalnego przepływu (łącznie z przepływem zapisanym wcześniej)
+    """
+    network = _as_array_network(G)
+    if source == sink:
+        return 0
+    existing = network.flow_value(source)
+    n, head, cap, first, next_arc = _residual_lists(network)
+    s, t = network.index[source], network.index[sink]
+    return existing + _push_relabel(n, head, cap, first, next_arc, s, t)
+
+
+# ============================
+# PRZEPŁYW PRZYROSTOWY I MINIMALNE CIĘCIE
+# ============================
+class IncrementalMaxFlow:
+    """
+    Maksymalny przepływ z zachowaną siecią rezydualną.
+
+    Po rozwiązaniu (algorytm Dinica) sieć rezydualna nie jest wyrzucana, dzięki
+    czemu można odczytać minimalne cięcie oraz zmieniać przepustowości pojedynczych
+    krawędzi bez liczenia przepływu od zera:
+      - zwiększenie przepustowości - dalsze powiększanie bieżącego przepływu,
+      - zmniejszenie poniżej przepływu krawędzi - nadmiar jest najpierw
+        przekierowany z u do v innymi ścieżkami, a resztę cofa się do źródła
+        (z u) i od ujścia (do v); na końcu przepływ jest ponownie powiększany.
+
+    Atrybuty:
+        network (ArrayFlowNetwork): Sieć (przepływ zapisywany przez sync()).
+        value: Bieżąca wartość maksymalnego przepływu.
+    """
+
+    __slots__ = ("network", "s", "t", "value", "_head", "_cap", "_first", "_next", "_arc")
+
+    def __init__(self, G, source, sink):
+        if source == sink:
+            raise ValueError("Źródło i ujście muszą być różne")
+        self.network = _as_array_network(G)
+        self.s = self.network.add_node(source)
+        self.t = self.network.add_node(sink)
+        n, self._head, self._cap, self._first, self._next = _residual_lists(self.network)
+        # Para (u, v) -> pierwszy łuk krawędzi u -> v
+        self._arc = {}
+        for e in range(len(self._head) - 2, -1, -2):
+            self._arc[(self._head[e ^ 1], self._head[e])] = e
+        self.value = self.network.flow_value(source)
+        self.value += self._augment(self.s, self.t)
+
+    def _augment(self, s, t, limit=float("inf")):
+        """Przesyła do limit jednostek z s do t w sieci rezydualnej (s == t - nic)."""
+        if s == t:
+            return limit
+        return _dinic(len(self._first), self._head, self._cap, self._first, self._next, s, t, limit)
+
+    def _new_edge(self, u, v, capacity):
+        e = self.network.add_edge(u, v, capacity)
+        iu, iv = self.network.index[u], self.network.index[v]
+        while len(self._first) < len(self.network):
+            self._first.append(-1)
+        for tail, tip, c in ((iu, iv, capacity), (iv, iu, 0)):
+            self._head.append(tip)
+            self._cap.append(c)
+            self._next.append(self._first[tail])
+            self._first[tail] = len(self._head) - 1
+        self._arc[(iu, iv)] = e
+        return e
+
+    def set_capacity(self, u, v, capacity):
+        """
+        Zmienia przepustowość krawędzi u -> v (dodaje ją, jeśli nie istnieje)
+        i aktualizuje maksymalny przepływ. Zwraca nową wartość przepływu.
+        """
+        network = self.network
+        key = (network.index.get(u), network.index.get(v))
+        e = self._arc.get(key)
+        if e is None:
+            self._new_edge(u, v, capacity)
+            self.value += self._augment(self.s, self.t)
+            return self.value
+
+        old = network.capacity[e]
+        network.capacity[e] = capacity
+        flow = old - self._cap[e]
+
+        if flow <= capacity:
+            # Bieżący przepływ mieści się w nowej przepustowości
+            self._cap[e] += capacity - old
+        else:
+            iu, iv = key
+            excess = flow - capacity
+            self._cap[e] = 0
+            self._cap[e ^ 1] -= excess
+            # 1. Przekierowanie nadmiaru z u do v innymi ścieżkami
+            excess -= self._augment(iu, iv, excess)
+            if excess > 0:
+                # 2. Cofnięcie reszty: z u do źródła i z ujścia do v
+                back = self._augment(iu, self.s, excess)
+                forward = self._augment(self.t, iv, excess)
+                if back < excess or forward < excess:
+                    # Nie powinno się zdarzyć dla poprawnego przepływu - rozwiązanie od zera
+                    return self.resolve()
+                self.value -= excess
+
+        self.value += self._augment(self.s, self.t)
+        return self.value
+
+    def resolve(self):
+        """Liczy przepływ od zera dla bieżących przepustowości."""
+        self._cap = list(self.network.capacity)
+        self.value = self._augment(self.s, self.t)
+        return self.value
+
+    def min_cut(self):
+        """
+        Minimalne cięcie s-t: zbiór S wierzchołków osiągalnych ze źródła w sieci
+        rezydualnej oraz krawędzie z S do reszty grafu (ich suma przepustowości
+        równa się wartości maksymalnego przepływu).
+        :return: (S, lista krawędzi (u, v))
+        """
+        n = len(self._first)
+        reachable = bytearray(n)
+        reachable[self.s] = 1
+        queue = deque([self.s])
+        while queue:
+            u = queue.popleft()
+            e = self._first[u]
+            while e != -1:
+                v = self._head[e]
+                if self._cap[e] > 0 and not reachable[v]:
+                    reachable[v] = 1
+                    queue.append(v)
+                e = self._next[e]
+
+        labels = self.network.labels
+        head = self._head
+        S = {labels[v] for v in range(n) if reachable[v]}
+        cut = [
+            (labels[head[e ^ 1]], labels[head[e]])
+            for e in range(0, len(head), 2)
+            if reachable[head[e ^ 1]] and not reachable[head[e]]
+        ]
+        return S, cut
+
+    def sync(self):
+        """Zapisuje bieżący przepływ w tablicy flow sieci i zwraca sieć."""
+        self.network.set_residual(self._cap)
+        return self.network
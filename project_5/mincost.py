@@ -0,0 +1,203 @@
+import heapq  # Kolejka priorytetowa dla algorytmu Dijkstry
+from collections import deque  # Kolejka aktywnych wierzchołków
+
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+from project_4.johnson import johnson_potentials
+from project_5.maxflow import _as_array_network, _dinic, _residual_lists
+
+
+# ============================
+# PRZEPŁYW O MINIMALNYM KOSZCIE
+# ============================
+# Obie metody działają na tablicowej sieci rezydualnej z ArrayFlowNetwork
+# (łuk przeciwny do e to e ^ 1, cost[e ^ 1] == -cost[e]) i liczą przepływ od zera.
+
+
+def _initial_potentials(n, head, cap, cost):
+    """
+    Potencjały Johnsona dla łuków z dodatnią przepustowością (Bellman-Ford
+    z project_4). Zerowe, gdy żaden koszt nie jest ujemny.
+    """
+    if all(cost[e] >= 0 for e in range(len(head)) if cap[e] > 0):
+        return [0] * n
+    arcs = [e for e in range(len(head)) if cap[e] > 0]
+    graph = CSRGraph.from_edges(
+        np.array([head[e ^ 1] for e in arcs], dtype=np.int64),
+        np.array([head[e] for e in arcs], dtype=np.int64),
+        np.array([cost[e] for e in arcs], dtype=np.float64),
+        n=n,
+        directed=True,
+    )
+    # ValueError dla cyklu o ujemnym koszcie (wymaga metody cost_scaling)
+    return [int(h) if float(h).is_integer() else float(h) for h in johnson_potentials(graph)]
+
+
+def _dijkstra_reduced(n, head, cap, cost, first, next_arc, potential, s):
+    """Odległości od s w sieci rezydualnej dla kosztów zredukowanych (nieujemnych)."""
+    inf = float("inf")
+    dist = [inf] * n
+    dist[s] = 0
+    heap = [(0, s)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        pu = potential[u]
+        e = first[u]
+        while e != -1:
+            if cap[e] > 0:
+                v = head[e]
+                nd = d + cost[e] + pu - potential[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+            e = next_arc[e]
+    return dist
+
+
+def _successive_shortest_paths(n, head, cap, cost, first, next_arc, s, t, demand):
+    """
+    Metoda kolejnych najkrótszych ścieżek w wersji prymalno-dualnej: po każdym
+    przebiegu Dijkstry potencjały są aktualizowane, a przepływ powiększany
+    algorytmem Dinica w podgrafie łuków o zerowym koszcie zredukowanym
+    (wszystkie najkrótsze ścieżki naraz). Zwraca wartość przepływu.
+    """
+    inf = float("inf")
+    # Tolerancja porównania kosztów zredukowanych z zerem dla kosztów rzeczywistych
+    tolerance = 0 if all(isinstance(c, int) for c in cost) else 1e-9
+    potential = _initial_potentials(n, head, cap, cost)
+    flow = 0
+    while flow < demand:
+        dist = _dijkstra_reduced(n, head, cap, cost, first, next_arc, potential, s)
+        if dist[t] == inf:
+            break
+        # Wierzchołki nieosiągalne dostają największą skończoną odległość,
+        # co zachowuje nieujemność kosztów zredukowanych
+        reach = max(d for d in dist if d != inf)
+        for v in range(n):
+            potential[v] += dist[v] if dist[v] != inf else reach
+
+        admissible = [
+            c if c > 0 and cost[e] + potential[head[e ^ 1]] - potential[head[e]] <= tolerance else 0
+            for e, c in enumerate(cap)
+        ]
+        before = admissible[:]
+        flow += _dinic(n, head, admissible, first, next_arc, s, t, demand - flow)
+        # Przepływ przesłany w podgrafie dopuszczalnym przenoszony do pełnej sieci
+        for e, c in enumerate(before):
+            if admissible[e] != c:
+                cap[e] -= c - admissible[e]
+    return flow
+
+
+def _refine(n, head, cap, cost, first, next_arc, price, eps):
+    """
+    Krok metody skalowania kosztów (Goldberg, Tarjan): z przepływu 2eps-optymalnego
+    robi eps-optymalny. Łuki o ujemnym koszcie zredukowanym są nasycane, a powstałe
+    nadmiary rozładowywane operacjami push/relabel (kolejka FIFO).
+    """
+    excess = [0] * n
+    for e in range(len(head)):
+        if cap[e] > 0 and cost[e] + price[head[e ^ 1]] - price[head[e]] < 0:
+            delta = cap[e]
+            cap[e] = 0
+            cap[e ^ 1] += delta
+            excess[head[e ^ 1]] -= delta
+            excess[head[e]] += delta
+
+    current = first[:]
+    active = deque(v for v in range(n) if excess[v] > 0)
+    while active:
+        u = active.popleft()
+        pu = price[u]
+        while excess[u] > 0:
+            e = current[u]
+            if e == -1:
+                # Podniesienie ceny: najtańszy łuk rezydualny staje się dopuszczalny
+                pu = max(
+                    price[head[a]] - cost[a] for a in _residual_arcs(first, next_arc, cap, u)
+                ) - eps
+                price[u] = pu
+                current[u] = first[u]
+                continue
+            v = head[e]
+            if cap[e] > 0 and cost[e] + pu - price[v] < 0:
+                delta = excess[u] if excess[u] < cap[e] else cap[e]
+                cap[e] -= delta
+                cap[e ^ 1] += delta
+                excess[u] -= delta
+                if excess[v] <= 0 < excess[v] + delta:
+                    active.append(v)
+                excess[v] += delta
+            else:
+                current[u] = next_arc[e]
+
+
+def _residual_arcs(first, next_arc, cap, u):
+    e = first[u]
+    while e != -1:
+        if cap[e] > 0:
+            yield e
+        e = next_arc[e]
+
+
+def _cost_scaling(n, head, cap, cost, first, next_arc, s, t, demand, alpha=8):
+    """
+    Przepływ o wartości min(demand, maksymalny) wyznaczony algorytmem Dinica,
+    a następnie poprawiany do minimalnego kosztu metodą skalowania kosztów.
+    Koszty muszą być całkowite; są mnożone przez n + 1, dzięki czemu
+    przepływ 1-optymalny dla kosztów przeskalowanych jest optymalny.
+    Zwraca wartość przepływu.
+    """
+    if not all(isinstance(c, int) for c in cost):
+        raise ValueError("Metoda cost_scaling wymaga całkowitych kosztów")
+    flow = _dinic(n, head, cap, first, next_arc, s, t, demand)
+
+    scaled = [c * (n + 1) for c in cost]
+    price = [0] * n
+    eps = max((abs(c) for c in scaled), default=0)
+    while eps > 1:
+        eps = max(1, eps // alpha)
+        _refine(n, head, cap, scaled, first, next_arc, price, eps)
+    return flow
+
+
+def min_cost_flow(G, source, sink, demand=None, method="ssp"):
+    """
+    Przepływ o minimalnym koszcie ze źródła do ujścia.
+
+    Parametry:
+        G: FlowNetwork (koszty z add_edge(..., cost)) lub ArrayFlowNetwork.
+        source, sink: Źródło i ujście.
+        demand: Żądana wartość przepływu (None - przepływ maksymalny). Jeśli sieć
+            nie pozwala jej osiągnąć, wyznaczany jest przepływ maksymalny.
+        method: "ssp" - kolejne najkrótsze ścieżki (Dijkstra z potencjałami
+            Johnsona; ujemne koszty dozwolone bez cykli o ujemnym koszcie),
+            "cost_scaling" - skalowanie kosztów push-relabel (całkowite koszty,
+            także cykle o ujemnym koszcie); liczba faz zależy od log(n * max|koszt|),
+            więc zwykle jest szybsza przy dużym rozrzucie kosztów (np. zadania przydziału).
+
+    Zwraca:
+        (wartość przepływu, koszt). Dla ArrayFlowNetwork przepływ zapisywany jest
+        w tablicy flow sieci.
+    """
+    network = _as_array_network(G)
+    if source == sink:
+        return 0, 0
+    network.reset_flow()
+    n, head, cap, first, next_arc = _residual_lists(network)
+    cost = network.cost.tolist()
+    s, t = network.index[source], network.index[sink]
+    demand = float("inf") if demand is None else demand
+
+    if method == "ssp":
+        flow = _successive_shortest_paths(n, head, cap, cost, first, next_arc, s, t, demand)
+    elif method == "cost_scaling":
+        flow = _cost_scaling(n, head, cap, cost, first, next_arc, s, t, demand)
+    else:
+        raise ValueError("method must be 'ssp' or 'cost_scaling'")
+
+    network.set_residual(cap)
+    return flow, network.total_cost()
@@ -0,0 +1,45 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from project_3.algorithms import kruskal_edges
+from project_3.boruvka import boruvka_edges
+
+
+def _random_graph(n, m, seed, distinct=True):
+    rng = np.random.default_rng(seed)
+    src, dst = rng.integers(0, n, m), rng.integers(0, n, m)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    weights = rng.permutation(src.size) + 1.0 if distinct else rng.integers(1, 5, src.size) * 1.0
+    return src, dst, weights
+
+
+def _forest_weight(src, dst, weights, n):
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+        if not G.has_edge(u, v) or G[u][v]["weight"] > w:
+            G.add_edge(u, v, weight=w)
+    return nx.minimum_spanning_tree(G).size(weight="weight")
+
+
+@pytest.mark.parametrize("distinct", [True, False])
+def test_minimum_spanning_forest(distinct):
+    n = 300
+    src, dst, weights = _random_graph(n, 900, seed=1, distinct=distinct)
+    chosen = boruvka_edges(src, dst, weights, n)
+    assert weights[chosen].sum() == pytest.approx(_forest_weight(src, dst, weights, n))
+    assert chosen.size == kruskal_edges(src, dst, weights, n).size
+
+
+def test_parallel_matches_serial():
+    n = 2000
+    src, dst, weights = _random_graph(n, 8000, seed=2, distinct=False)
+    serial = boruvka_edges(src, dst, weights, n)
+    assert np.array_equal(boruvka_edges(src, dst, weights, n, workers=2), serial)
+
+
+def test_no_edges():
+    empty = np.zeros(0, dtype=np.int64)
+    assert boruvka_edges(empty, empty, np.zeros(0), 4, workers=2).size == 0
@@ -0,0 +1,31 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from project_1.csr_graph import CSRGraph
+from project_3.eccentricity import approximate_closeness, eccentricity_center
+
+
+@pytest.fixture
+def graph():
+    G = nx.connected_watts_strogatz_graph(150, 4, 0.2, seed=2)
+    return G, CSRGraph.from_networkx(G)
+
+
+def test_eccentricity_center_is_minmax_center(graph):
+    G, csr = graph
+    eccentricity = nx.eccentricity(G)
+    assert eccentricity[eccentricity_center(csr)] == min(eccentricity.values())
+
+
+def test_closeness_with_all_sources_is_exact(graph):
+    G, csr = graph
+    expected = nx.closeness_centrality(G)
+    estimated = approximate_closeness(csr, samples=len(G), seed=1)
+    assert np.allclose(estimated, [expected[v] for v in G.nodes()])
+
+
+@pytest.mark.parametrize("samples", [0, -3])
+def test_closeness_rejects_empty_sample(graph, samples):
+    with pytest.raises(ValueError):
+        approximate_closeness(graph[1], samples)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from project_5.flow_generator import generate_layered_flow_network
+
+
+def _edges(G):
+    arcs = np.arange(0, len(G.head), 2)
+    return np.array([G.head[e ^ 1] for e in arcs]), np.array([G.head[e] for e in arcs])
+
+
+def test_layered_structure():
+    G, layers = generate_layered_flow_network(5, width=(2, 6), density=0.3, seed=11)
+    source, sink = layers[0][0], layers[-1][0]
+    assert G.in_degree(source) == 0 and G.out_degree(sink) == 0
+    for layer in layers[1:-1]:
+        assert all(G.in_degree(v) > 0 and G.out_degree(v) > 0 for v in layer)
+    tails, heads = _edges(G)
+    assert not np.any(tails == heads)
+    pairs = {frozenset(p) for p in zip(tails.tolist(), heads.tolist())}
+    assert len(pairs) == G.number_of_edges()
+
+
+def test_same_seed_same_network():
+    first, _ = generate_layered_flow_network(4, width=(3, 5), seed=3)
+    second, _ = generate_layered_flow_network(4, width=(3, 5), seed=3)
+    assert first.edge_flows().keys() == second.edge_flows().keys()
+    assert list(first.capacity) == list(second.capacity)
+
+
+def test_extra_edges_fill_every_free_pair():
+    G, _ = generate_layered_flow_network(3, width=3, density=0.5, extra_edges=0, seed=1)
+    n, m = len(G), G.number_of_edges()
+    free = n * (n - 1) // 2 - m
+    full, _ = generate_layered_flow_network(3, width=3, density=0.5, extra_edges=free, seed=1)
+    assert full.number_of_edges() == n * (n - 1) // 2
+    with pytest.raises(ValueError):
+        generate_layered_flow_network(3, width=3, density=0.5, extra_edges=free + 1, seed=1)
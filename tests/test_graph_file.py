@@ -0,0 +1,35 @@
+import networkx as nx
+import numpy as np
+
+from project_1.csr_graph import CSRGraph
+from project_1.graph_file import load_csr, save_csr
+
+
+def _roundtrip(G, tmp_path):
+    graph = CSRGraph.from_networkx(G)
+    path = tmp_path / "graph.csr"
+    save_csr(graph, path)
+    return graph, load_csr(path)
+
+
+def test_numpy_integer_labels(tmp_path):
+    G = nx.relabel_nodes(nx.path_graph(4), {i: np.int64(10 + i) for i in range(4)})
+    graph, loaded = _roundtrip(G, tmp_path)
+    assert loaded.labels == [10, 11, 12, 13]
+    assert all(type(label) is int for label in loaded.labels)
+    assert np.array_equal(loaded.indices, graph.indices)
+
+
+def test_tuple_labels_are_hashable_after_load(tmp_path):
+    G = nx.grid_2d_graph(3, 2)
+    graph, loaded = _roundtrip(G, tmp_path)
+    assert loaded.labels == list(G.nodes())
+    assert {label: i for i, label in enumerate(loaded.labels)}
+
+
+def test_unserializable_labels_are_skipped(tmp_path):
+    G = nx.relabel_nodes(nx.path_graph(3), {i: object() for i in range(3)})
+    graph, loaded = _roundtrip(G, tmp_path)
+    assert loaded.labels is None
+    assert np.array_equal(loaded.indptr, graph.indptr)
+    assert np.array_equal(loaded.weights, graph.weights)
@@ -0,0 +1,61 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from project_1.csr_graph import CSRGraph
+from project_1.graph_file import load_csr, save_csr
+from project_4.johnson import johnson_parallel, johnson_potentials
+
+
+@pytest.fixture
+def graph():
+    rng = np.random.default_rng(4)
+    n = 60
+    src, dst = rng.integers(0, n, 400), rng.integers(0, n, 400)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    # Ujemne wagi (>= -5) tylko na krawędziach u < v, a każdy cykl zawiera krawędź
+    # wsteczną o wadze >= 5n, więc cykli o ujemnej wadze nie ma
+    forward = rng.integers(-5, 20, src.size)
+    weights = np.where(src < dst, forward, rng.integers(5 * n, 6 * n, src.size))
+    G = nx.DiGraph()
+    G.add_nodes_from(range(n))
+    for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+        if not G.has_edge(u, v) or G[u][v]["weight"] > w:
+            G.add_edge(u, v, weight=float(w))
+    return G, CSRGraph.from_networkx(G)
+
+
+def _expected(G):
+    lengths = dict(nx.johnson(G, weight="weight"))
+    n = len(G)
+    D = np.full((n, n), math.inf)
+    for u, paths in lengths.items():
+        for v, path in paths.items():
+            D[u, v] = nx.path_weight(G, path, weight="weight")
+    return D
+
+
+def test_matches_networkx(graph):
+    G, csr = graph
+    assert np.allclose(johnson_parallel(csr), _expected(G))
+
+
+def test_parallel_and_mapped_file_match_serial(graph, tmp_path):
+    _, csr = graph
+    serial = johnson_parallel(csr)
+    assert np.array_equal(johnson_parallel(csr, workers=2, chunk_size=8), serial)
+    path = tmp_path / "graph.csr"
+    save_csr(csr, path)
+    h = johnson_potentials(csr)
+    assert np.array_equal(johnson_parallel(load_csr(path), workers=2, h=h), serial)
+
+
+def test_negative_cycle_is_rejected():
+    csr = CSRGraph.from_edges(
+        np.array([0, 1, 2]), np.array([1, 2, 0]), np.array([1.0, -3.0, 1.0]), n=3, directed=True
+    )
+    with pytest.raises(ValueError):
+        johnson_potentials(csr)
@@ -0,0 +1,40 @@
+import networkx as nx
+import pytest
+
+from project_5.flow_generator import generate_layered_flow_network
+from project_5.maxflow import dinic, push_relabel
+from project_5.mincost import min_cost_flow
+
+
+@pytest.fixture
+def network():
+    G, layers = generate_layered_flow_network(6, width=(3, 6), density=0.4, seed=7)
+    return G, layers[0][0], layers[-1][0]
+
+
+def _expected(G, source, sink):
+    D = nx.DiGraph()
+    flow_network = G.to_flow_network()
+    for u in flow_network.graph:
+        for v, capacity in flow_network.graph[u].items():
+            D.add_edge(u, v, capacity=capacity)
+    return nx.maximum_flow_value(D, source, sink)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [(dinic, push_relabel), (push_relabel, dinic), (dinic, dinic), (push_relabel, push_relabel)],
+)
+def test_engines_in_a_row_agree(network, first, second):
+    G, source, sink = network
+    expected = _expected(G, source, sink)
+    assert first(G, source, sink) == expected
+    assert second(G, source, sink) == expected
+
+
+def test_dinic_after_min_cost_flow(network):
+    G, source, sink = network
+    value, _ = min_cost_flow(G, source, sink, demand=1)
+    assert value == 1
+    assert dinic(G, source, sink) == _expected(G, source, sink)
+    assert G.flow_value(source) == _expected(G, source, sink)
@@ -0,0 +1,72 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from project_5.flow_generator import generate_layered_flow_network
+from project_5.flow_graph import ArrayFlowNetwork
+from project_5.main import FlowNetwork
+from project_5.mincost import min_cost_flow
+
+
+def _with_costs(seed, low=1):
+    G, layers = generate_layered_flow_network(4, width=(2, 5), density=0.5, seed=seed)
+    rng = np.random.default_rng(seed)
+    arcs = range(0, len(G.head), 2)
+    tails = [G.head[e ^ 1] for e in arcs]
+    heads = [G.head[e] for e in arcs]
+    capacities = [G.capacity[e] for e in arcs]
+    # Ujemne koszty tylko "do przodu" (tail < head) - brak cykli o ujemnym koszcie
+    costs = [
+        int(rng.integers(low, 10)) if u < v else int(rng.integers(1, 10)) + 100
+        for u, v in zip(tails, heads)
+    ]
+    network = ArrayFlowNetwork.from_arrays(tails, heads, capacities, costs, labels=G.labels)
+    return network, layers[0][0], layers[-1][0]
+
+
+def _networkx(G):
+    D = nx.DiGraph()
+    for e in range(0, len(G.head), 2):
+        u, v = G.labels[G.head[e ^ 1]], G.labels[G.head[e]]
+        D.add_edge(u, v, capacity=G.capacity[e], weight=G.cost[e])
+    return D
+
+
+@pytest.mark.parametrize("method", ["ssp", "cost_scaling"])
+@pytest.mark.parametrize("seed, low", [(1, 1), (2, 1), (3, -5)])
+def test_max_flow_min_cost_matches_networkx(method, seed, low):
+    G, source, sink = _with_costs(seed, low)
+    D = _networkx(G)
+    flow = nx.max_flow_min_cost(D, source, sink)
+    value, cost = min_cost_flow(G, source, sink, method=method)
+    assert value == nx.maximum_flow_value(D, source, sink)
+    assert cost == nx.cost_of_flow(D, flow)
+    assert G.flow_value(source) == value and G.total_cost() == cost
+
+
+@pytest.mark.parametrize("method", ["ssp", "cost_scaling"])
+def test_demand_limited_flow(method):
+    G, source, sink = _with_costs(4)
+    D = _networkx(G)
+    demand = nx.maximum_flow_value(D, source, sink) // 2
+    D.nodes[source]["demand"], D.nodes[sink]["demand"] = -demand, demand
+    value, cost = min_cost_flow(G, source, sink, demand=demand, method=method)
+    assert value == demand
+    assert cost == nx.cost_of_flow(D, nx.min_cost_flow(D))
+
+
+def test_flow_network_input():
+    F = FlowNetwork()
+    F.add_edge("s", "a", 2, cost=1)
+    F.add_edge("s", "b", 2, cost=4)
+    F.add_edge("a", "t", 1, cost=1)
+    F.add_edge("a", "b", 2, cost=1)
+    F.add_edge("b", "t", 3, cost=1)
+    assert min_cost_flow(F, "s", "t") == (4, 15)
+
+
+def test_cost_scaling_requires_integer_costs():
+    G = ArrayFlowNetwork.from_arrays([0, 1], [1, 2], [1, 1], [0.5, 1.0])
+    with pytest.raises(ValueError):
+        min_cost_flow(G, 0, 2, method="cost_scaling")
+    assert min_cost_flow(G, 0, 2) == (1, 1.5)
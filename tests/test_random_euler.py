@@ -0,0 +1,31 @@
+import networkx as nx
+import pytest
+
+# project_2 rysuje grafy przez project_1.draw_graph, który wymaga backendu Tk
+random_euler = pytest.importorskip(
+    "project_2.random_euler",
+    reason="project_1.draw_graph requires the Tk backend",
+    exc_type=ImportError,
+)
+generate_euler_graph_fast = random_euler.generate_euler_graph_fast
+
+
+@pytest.mark.parametrize("n, max_ear", [(3, None), (4, 2), (50, None), (500, 2), (500, 40)])
+def test_generated_graph_is_eulerian(n, max_ear):
+    G = generate_euler_graph_fast(n, max_ear=max_ear, seed=n)
+    assert G.number_of_nodes() == n
+    assert nx.is_eulerian(G)
+    assert nx.number_of_selfloops(G) == 0
+
+
+def test_edge_array_matches_graph():
+    edges = generate_euler_graph_fast(200, seed=5, as_array=True)
+    G = generate_euler_graph_fast(200, seed=5)
+    assert sorted(map(sorted, edges.tolist())) == sorted(map(sorted, G.edges()))
+    assert len({tuple(sorted(e)) for e in edges.tolist()}) == len(edges)
+
+
+@pytest.mark.parametrize("kwargs", [{"nodes_num": 2}, {"nodes_num": 10, "max_ear": 1}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        generate_euler_graph_fast(**kwargs)
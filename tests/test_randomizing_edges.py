@@ -0,0 +1,45 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+# project_2 rysuje grafy przez project_1.draw_graph, który wymaga backendu Tk
+randomizing_edges = pytest.importorskip(
+    "project_2.randomizing_edges",
+    reason="project_1.draw_graph requires the Tk backend",
+    exc_type=ImportError,
+)
+rewire_edges = randomizing_edges.rewire_edges
+
+
+def _degrees(edges, n):
+    return np.bincount(np.asarray(edges).ravel(), minlength=n)
+
+
+def test_degrees_preserved_for_edge_array():
+    G = nx.gnm_random_graph(200, 800, seed=1)
+    edges = np.array(G.edges())
+    rewired, stats = rewire_edges(edges, 500, seed=2)
+    assert stats["accepted"] == 500
+    assert np.array_equal(_degrees(rewired, 200), _degrees(edges, 200))
+    assert not np.any(rewired[:, 0] == rewired[:, 1])
+    keys = np.sort(rewired, axis=1)
+    assert len(np.unique(keys, axis=0)) == len(keys)
+
+
+def test_unswapped_edges_keep_attributes():
+    G = nx.cycle_graph(20)
+    nx.set_edge_attributes(G, 5, "weight")
+    before = {frozenset(e) for e in G.edges()}
+    G, stats = rewire_edges(G, 3, seed=1)
+    assert stats["accepted"] == 3
+    assert all(d == 2 for _, d in G.degree())
+    kept = [e for e in G.edges() if frozenset(e) in before]
+    assert kept and all(G.edges[e] == {"weight": 5} for e in kept)
+
+
+def test_connected_rewiring_stays_connected():
+    G = nx.connected_watts_strogatz_graph(100, 4, 0.1, seed=3)
+    degrees = dict(G.degree())
+    G, stats = rewire_edges(G, 300, seed=4, connected=True)
+    assert nx.is_connected(G)
+    assert dict(G.degree()) == degrees
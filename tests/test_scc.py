@@ -0,0 +1,49 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from project_1.csr_graph import CSRGraph
+from project_4.scc import condensation, kosaraju_scc, tarjan_scc
+
+
+def _partition(labels):
+    groups = {}
+    for v, label in enumerate(labels.tolist()):
+        groups.setdefault(label, set()).add(v)
+    return sorted(map(frozenset, groups.values()), key=min)
+
+
+@pytest.fixture
+def graph():
+    G = nx.gnm_random_graph(300, 600, seed=8, directed=True)
+    return G, CSRGraph.from_networkx(G)
+
+
+@pytest.mark.parametrize("scc", [tarjan_scc, kosaraju_scc])
+def test_components_match_networkx(graph, scc):
+    G, csr = graph
+    expected = sorted(map(frozenset, nx.strongly_connected_components(G)), key=min)
+    assert _partition(scc(csr)) == expected
+
+
+@pytest.mark.parametrize("scc", [tarjan_scc, kosaraju_scc])
+def test_long_path_has_no_recursion_limit(scc):
+    n = 50000
+    # Jeden cykl 0 -> 1 -> ... -> n-1 -> 0 głębszy niż limit rekurencji
+    csr = CSRGraph.from_edges(np.arange(n), (np.arange(n) + 1) % n, n=n, directed=True)
+    assert np.all(scc(csr) == scc(csr)[0])
+
+
+def test_condensation_is_topologically_numbered(graph):
+    G, csr = graph
+    labels, dag = condensation(csr)
+    src, dst, _ = dag.arcs()
+    assert np.all(src < dst)
+    expected = nx.condensation(G)
+    assert len(dag) == expected.number_of_nodes()
+    assert dag.indices.size == expected.number_of_edges()
+
+
+def test_adjacency_matrix_input():
+    matrix = [[0, 1, 0], [1, 0, 1], [0, 0, 0]]
+    assert _partition(tarjan_scc(matrix)) == [frozenset({0, 1}), frozenset({2})]
@@ -0,0 +1,58 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from project_1.csr_graph import CSRGraph
+from project_3.algorithms import reconstruct_path, shortest_paths
+
+
+@pytest.fixture
+def graph():
+    G = nx.gnm_random_graph(200, 700, seed=5)
+    rng = np.random.default_rng(5)
+    for u, v in G.edges():
+        G[u][v]["weight"] = float(rng.integers(1, 50))
+    G.add_node(200)  # Wierzchołek izolowany
+    return G, CSRGraph.from_networkx(G)
+
+
+def test_distances_match_networkx(graph):
+    G, csr = graph
+    distances, predecessors = shortest_paths(csr, 0)
+    expected = nx.single_source_dijkstra_path_length(G, 0)
+    for v in G.nodes():
+        assert distances[v] == expected.get(v, math.inf)
+    assert predecessors[200] == -1 and reconstruct_path(predecessors, 0, 200) == []
+
+
+def test_path_reconstruction(graph):
+    G, csr = graph
+    distances, predecessors = shortest_paths(csr, 3)
+    path = reconstruct_path(predecessors, 3, 150)
+    assert path[0] == 3 and path[-1] == 150
+    assert nx.path_weight(G, path, weight="weight") == distances[150]
+
+
+def test_early_target_exit(graph):
+    G, csr = graph
+    full, _ = shortest_paths(csr, 0)
+    distances, predecessors = shortest_paths(csr, 0, target=150)
+    assert distances[150] == full[150]
+    settled = np.isfinite(distances)
+    assert np.array_equal(distances[settled], full[settled])
+    assert np.all(distances[settled] <= full[150])
+
+
+def test_max_distance(graph):
+    _, csr = graph
+    full, _ = shortest_paths(csr, 0)
+    limited, _ = shortest_paths(csr, 0, max_distance=40)
+    assert np.array_equal(np.isfinite(limited), full <= 40)
+    assert np.array_equal(limited[full <= 40], full[full <= 40])
+
+
+def test_adjacency_matrix_input():
+    matrix = [[0, 4, 1], [4, 0, 2], [1, 2, 0]]
+    assert shortest_paths(matrix, 0)[0].tolist() == [0, 3, 1]